@@ -38,13 +38,15 @@ picture strings, time zones, and advanced date/time operations used in JSONata e
 """
 
 
+import bisect
+import copy
 import datetime
 import functools
 import logging
 import math
 import re
-from collections import deque
-from typing import Optional, Sequence
+import sys
+from typing import Callable, Optional, Sequence, Union
 
 from src.jsonata.DateTimeUtils.Format import Format
 from src.jsonata.DateTimeUtils.TCase import TCase
@@ -60,10 +62,73 @@ from src.jsonata.Constants.Constants import Constants
 from src.jsonata.DateTimeUtils.GroupingSeparator import GroupingSeparator
 from src.jsonata.DateTimeUtils.MatcherPart import MatcherPart
 from src.jsonata.DateTimeUtils.PictureFormat import PictureFormat
+from src.jsonata.DateTimeUtils.LiteralSpecPart import LiteralSpecPart
 from src.jsonata.DateTimeUtils.SpecPart import SpecPart
 from src.jsonata.DateTimeUtils.RomanNumeral import RomanNumeral
 from src.jsonata.DateTimeUtils.YearMonth import YearMonth
-from src.jsonata.Functions.Functions import Functions
+
+_ROMAN_VALUES = {"M": 1000, "D": 500, "C": 100, "L": 50, "X": 10, "V": 5, "I": 1}
+
+# Roman numeral value per ASCII code (-1 for any other character)
+_ROMAN_LUT = tuple(_ROMAN_VALUES.get(chr(code), -1) for code in range(128))
+
+_ROMAN_TABLE = (
+    (1000, "m"),
+    (900, "cm"),
+    (500, "d"),
+    (400, "cd"),
+    (100, "c"),
+    (90, "xc"),
+    (50, "l"),
+    (40, "xl"),
+    (10, "x"),
+    (9, "ix"),
+    (5, "v"),
+    (4, "iv"),
+    (1, "i"),
+)
+
+_SUFFIX123 = {"1": "st", "2": "nd", "3": "rd"}
+
+_DEFAULT_PRESENTATION_MODIFIERS = {
+    "Y": "1",
+    "M": "1",
+    "D": "1",
+    "d": "1",
+    "F": "n",
+    "W": "1",
+    "w": "1",
+    "X": "1",
+    "x": "1",
+    "H": "1",
+    "h": "1",
+    "P": "n",
+    "m": "01",
+    "s": "01",
+    "f": "1",
+    "Z": "01:01",
+    "z": "01:01",
+    "C": "n",
+    "E": "n",
+}
+
+# presentation modifiers that may follow the primary one (e.g. "o" for ordinal)
+_PRESENTATION2_CHARS = frozenset("atco")
+
+# components that are formatted as integers
+_INTEGER_COMPONENTS = frozenset("YMDdFWwXxHhmsf")
+
+# date/time components that may also be presented as names
+_DATE_NAMED_COMPONENTS = frozenset("YMDdFWwXxHhms")
+
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+
+# bit of each specified component in the date and time masks of parse_datetime
+_DATE_MASK_BITS = {part: 1 << (7 - i) for i, part in enumerate("YXMxWwdD")}
+_TIME_MASK_BITS = {part: 1 << (5 - i) for i, part in enumerate("PHhmsf")}
+
+# components that default to 1 rather than 0 when left unspecified in parsing
+_ONE_BASED_COMPONENTS = frozenset("MDd")
 
 
 class DateTimeUtils:
@@ -129,6 +194,7 @@ class DateTimeUtils:
     _magnitudes = ["Thousand", "Million", "Billion", "Trillion"]
 
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def number_to_words(value: int, ordinal: bool) -> str:
         """
         Convert a number to its word representation.
@@ -141,112 +207,68 @@ class DateTimeUtils:
         return DateTimeUtils._lookup(value, False, ordinal)
 
     @staticmethod
-    def _lookup(num: int, prev: int, ordinal: bool) -> str:
+    def _lookup(num: int, prev: bool, ordinal: bool) -> str:
         """
-        Helper for number_to_words. Converts a number to words recursively.
+        Helper for number_to_words. Converts a number to words iteratively,
+        peeling off one magnitude (thousand, million, ...) per pass.
         """
-        if num <= 19:
-            words = (" and " if prev else "") + (
-                DateTimeUtils._ordinals[int(num)]
-                if ordinal
-                else DateTimeUtils._few[int(num)]
-            )
-        elif num < 100:
-            tens = math.trunc(int(num) / float(10))
-            remainder = int(math.fmod(int(num), 10))
-            words = (" and " if prev else "") + DateTimeUtils._decades[tens - 2]
-            if remainder > 0:
-                words += "-" + DateTimeUtils._lookup(remainder, False, ordinal)
-            elif ordinal:
-                words = words[0 : len(words) - 1] + "ieth"
-        elif num < 1000:
-            hundreds = math.trunc(int(num) / float(100))
-            remainder = int(math.fmod(int(num), 100))
-            words = (", " if prev else "") + DateTimeUtils._few[hundreds] + " Hundred"
-            if remainder > 0:
-                words += DateTimeUtils._lookup(remainder, True, ordinal)
-            elif ordinal:
-                words += "th"
-        else:
-            mag = int(math.floor(math.log10(num) / 3))
+        words = []
+        while num >= 1000:
+            # exact for any int, unlike math.log10 near powers of ten
+            mag = (len(str(num)) - 1) // 3
             if mag > len(DateTimeUtils._magnitudes):
                 mag = len(DateTimeUtils._magnitudes)  # the largest word
-            factor = int(10 ** (mag * 3))
-            mant = int(math.floor(math.trunc(num / float(factor))))
-            remainder = num - mant * factor
-            words = (
-                (", " if prev else "")
-                + DateTimeUtils._lookup(mant, False, False)
-                + " "
-                + str(DateTimeUtils._magnitudes[mag - 1])
-            )
-            if remainder > 0:
-                words += DateTimeUtils._lookup(remainder, True, ordinal)
-            elif ordinal:
-                words += "th"
-        return words
-
-    _word_values = {}
+            mant, num = divmod(num, 10 ** (mag * 3))
+            if prev:
+                words.append(", ")
+            if mant >= 1000:
+                # only reached beyond the largest magnitude word
+                words.append(DateTimeUtils._lookup(mant, False, False))
+            else:
+                words.append(DateTimeUtils._lookup_hundreds(mant, False, False))
+            words.append(" " + DateTimeUtils._magnitudes[mag - 1])
+            if num == 0:
+                if ordinal:
+                    words.append("th")
+                return "".join(words)
+            prev = True
+        words.append(DateTimeUtils._lookup_hundreds(num, prev, ordinal))
+        return "".join(words)
 
     @staticmethod
-    def _static_initializer():
-        """
-        Initializes word value mappings for number conversion.
-        """
-        i = 0
-        while i < len(DateTimeUtils._few):
-            DateTimeUtils._word_values[DateTimeUtils._few[i].casefold()] = i
-            i += 1
-        i = 0
-        while i < len(DateTimeUtils._ordinals):
-            DateTimeUtils._word_values[DateTimeUtils._ordinals[i].casefold()] = i
-            i += 1
-        i = 0
-        while i < len(DateTimeUtils._decades):
-            lword = DateTimeUtils._decades[i].casefold()
-            DateTimeUtils._word_values[lword] = (i + 2) * 10
-            DateTimeUtils._word_values[lword[0 : len(lword) - 1] + "ieth"] = (
-                DateTimeUtils._word_values[lword]
-            )
-            i += 1
-        DateTimeUtils._word_values["hundredth"] = 100
-        DateTimeUtils._word_values["hundreth"] = 100
-        i = 0
-        while i < len(DateTimeUtils._magnitudes):
-            lword = DateTimeUtils._magnitudes[i].casefold()
-            val = int(10 ** ((i + 1) * 3))
-            DateTimeUtils._word_values[lword] = val
-            DateTimeUtils._word_values[lword + "th"] = val
-            i += 1
-        i = 0
-        while i < len(DateTimeUtils._few):
-            DateTimeUtils._word_values_long[DateTimeUtils._few[i].casefold()] = int(i)
-            i += 1
-        i = 0
-        while i < len(DateTimeUtils._ordinals):
-            DateTimeUtils._word_values_long[DateTimeUtils._ordinals[i].casefold()] = (
-                int(i)
-            )
-            i += 1
-        i = 0
-        while i < len(DateTimeUtils._decades):
-            lword = DateTimeUtils._decades[i].casefold()
-            DateTimeUtils._word_values_long[lword] = int((i + 2)) * 10
-            DateTimeUtils._word_values_long[lword[0 : len(lword) - 1] + "ieth"] = (
-                DateTimeUtils._word_values_long[lword]
+    def _lookup_hundreds(num: int, prev: bool, ordinal: bool) -> str:
+        """
+        Helper for _lookup. Converts a number below 1000 to words.
+        """
+        words = []
+        if num >= 100:
+            hundreds, num = divmod(num, 100)
+            words.append(
+                (", " if prev else "") + DateTimeUtils._few[hundreds] + " Hundred"
             )
-            i += 1
-        DateTimeUtils._word_values_long["hundredth"] = 100
-        DateTimeUtils._word_values_long["hundreth"] = 100
-        i = 0
-        while i < len(DateTimeUtils._magnitudes):
-            lword = DateTimeUtils._magnitudes[i].casefold()
-            val = int(10 ** ((i + 1) * 3))
-            DateTimeUtils._word_values_long[lword] = val
-            DateTimeUtils._word_values_long[lword + "th"] = val
-            i += 1
-
-    _word_values_long = {}
+            if num == 0:
+                if ordinal:
+                    words.append("th")
+                return "".join(words)
+            prev = True
+        if num >= 20:
+            tens, num = divmod(num, 10)
+            decade = DateTimeUtils._decades[tens - 2]
+            if prev:
+                words.append(" and ")
+            if num == 0:
+                words.append(decade[:-1] + "ieth" if ordinal else decade)
+                return "".join(words)
+            words.append(decade + "-")
+            prev = False
+        if prev:
+            words.append(" and ")
+        words.append(
+            DateTimeUtils._ordinals[num] if ordinal else DateTimeUtils._few[num]
+        )
+        return "".join(words)
+
+    _words_split = re.compile(r",\s|\sand\s|[\s\-]")
 
     @staticmethod
     def words_to_number(text: str) -> int:
@@ -257,20 +279,19 @@ class DateTimeUtils:
         Returns:
             int: Numeric value.
         """
-        parts = re.split(",\\s|\\sand\\s|[\\s\\-]", text)
-        values = [DateTimeUtils._word_values[part] for i, part in enumerate(parts)]
-        segs = deque()
-        segs.append(0)
+        parts = DateTimeUtils._words_split.split(text)
+        values = [_WORD_VALUES[part] for part in parts]
+        total = 0
+        top = 0
         for value in values:
             if value < 100:
-                top = segs.pop()
                 if top >= 1000:
-                    segs.append(top)
+                    total += top
                     top = 0
-                segs.append(top + value)
+                top += value
             else:
-                segs.append(segs.pop() * value)
-        return sum(segs)
+                top *= value
+        return total + top
 
     #
     # long version of above
@@ -284,50 +305,12 @@ class DateTimeUtils:
         Returns:
             int: Long integer value.
         """
-        parts = re.split(",\\s|\\sand\\s|[\\s\\-]", text)
-        values = [DateTimeUtils._word_values_long[part] for i, part in enumerate(parts)]
-        segs = deque()
-        segs.append(int(0))
-        for value in values:
-            if value < 100:
-                top = segs.pop()
-                if top >= 1000:
-                    segs.append(top)
-                    top = int(0)
-                segs.append(top + value)
-            else:
-                segs.append(segs.pop() * value)
-        return sum(segs)
+        return DateTimeUtils.words_to_number(text)
 
-    @staticmethod
-    def _create_roman_values() -> dict[str, int]:
-        """
-        Create mapping of Roman numeral characters to values.
-        Returns:
-            dict[str, int]: Roman numeral value mapping.
-        """
-        values = {"M": 1000, "D": 500, "C": 100, "L": 50, "X": 10, "V": 5, "I": 1}
-        return values
-
-    _roman_numerals = [
-        RomanNumeral(1000, "m"),
-        RomanNumeral(900, "cm"),
-        RomanNumeral(500, "d"),
-        RomanNumeral(400, "cd"),
-        RomanNumeral(100, "c"),
-        RomanNumeral(90, "xc"),
-        RomanNumeral(50, "l"),
-        RomanNumeral(40, "xl"),
-        RomanNumeral(10, "x"),
-        RomanNumeral(9, "ix"),
-        RomanNumeral(5, "v"),
-        RomanNumeral(4, "iv"),
-        RomanNumeral(1, "i"),
-    ]
-
-    _roman_values = _create_roman_values.__func__()
+    _roman_numerals = [RomanNumeral(value, letters) for value, letters in _ROMAN_TABLE]
 
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def _decimal_to_roman(value: int) -> str:
         """
         Convert a decimal integer to Roman numeral string.
@@ -336,15 +319,12 @@ class DateTimeUtils:
         Returns:
             str: Roman numeral representation.
         """
-        i = 0
-        while i < len(DateTimeUtils._roman_numerals):
-            numeral = DateTimeUtils._roman_numerals[i]
-            if value >= numeral.get_value():
-                return numeral.get_letters() + DateTimeUtils._decimal_to_roman(
-                    value - numeral.get_value()
-                )
-            i += 1
-        return ""
+        letters = []
+        for numeral_value, numeral_letters in _ROMAN_TABLE:
+            count, value = divmod(value, numeral_value)
+            if count:
+                letters.append(numeral_letters * count)
+        return "".join(letters)
 
     @staticmethod
     def roman_to_decimal(roman: str) -> int:
@@ -354,11 +334,20 @@ class DateTimeUtils:
             roman (str): Roman numeral string.
         Returns:
             int: Decimal value.
+        Raises:
+            KeyError: If the string contains a character that is not a Roman numeral.
         """
+        try:
+            codes = roman.encode("ascii")
+        except UnicodeEncodeError as exc:
+            raise KeyError(roman[exc.start]) from None
         decimal_val = 0
         max_val = 1
-        for digit in reversed(roman):
-            value = DateTimeUtils._roman_values[digit]
+        lut = _ROMAN_LUT
+        for code in reversed(codes):
+            value = lut[code]
+            if value < 0:
+                raise KeyError(chr(code))
             if value < max_val:
                 decimal_val -= value
             else:
@@ -377,11 +366,11 @@ class DateTimeUtils:
             str: Letter representation.
         """
         letters = []
-        a_code = a_char[0]
+        a_code = ord(a_char[0])
         while value > 0:
-            letters.insert(0, chr((value - 1) % 26 + ord(a_code)))
-            value = math.trunc((value - 1) / float(26))
-        return "".join(letters)
+            value, rem = divmod(value - 1, 26)
+            letters.append(chr(rem + a_code))
+        return "".join(reversed(letters))
 
     @staticmethod
     def format_integer(value: int, picture: Optional[str]) -> str:
@@ -406,8 +395,7 @@ class DateTimeUtils:
         Returns:
             Optional[int]: Parsed integer or None.
         """
-        format_spec = DateTimeUtils._analyse_integer_picture(picture)
-        match_spec = DateTimeUtils._generate_regex_with_component(None, format_spec)
+        match_spec = DateTimeUtils._compile_integer_parser(picture)
         # //const fullRegex = '^' + matchSpec.regex + '$'
         # //const matcher = new RegExp(fullRegex)
         # // TODO validate input based on the matcher regex
@@ -415,16 +403,18 @@ class DateTimeUtils:
         return result
 
     @staticmethod
-    def _create_suffix_map() -> dict[str, str]:
+    @functools.lru_cache(maxsize=256)
+    def _compile_integer_parser(picture: Optional[str]) -> MatcherPart:
         """
-        Create a mapping for ordinal suffixes.
+        Build the matcher for an integer picture, cached per picture.
+        Matchers hold no per-call state, so the cached instance is shared.
+        Args:
+            picture (Optional[str]): The format picture.
         Returns:
-            dict[str, str]: Suffix mapping.
+            MatcherPart: Matcher object.
         """
-        suffix = {"1": "st", "2": "nd", "3": "rd"}
-        return suffix
-
-    _suffix123 = _create_suffix_map.__func__()
+        format_spec = DateTimeUtils._analyse_integer_picture(picture)
+        return DateTimeUtils._generate_regex_with_component(None, format_spec)
 
     @staticmethod
     def _format_integer(value: int, fmt: Optional[Format]) -> str:
@@ -444,72 +434,55 @@ class DateTimeUtils:
                 int(value),
                 "A" if fmt.case_type == TCase.UPPER else "a",
             )
-        elif format.primary == Formats.ROMAN:
+        elif fmt.primary == Formats.ROMAN:
             formatted_integer = DateTimeUtils._decimal_to_roman(int(value))
-            if format.case_type == TCase.UPPER:
+            if fmt.case_type == TCase.UPPER:
                 formatted_integer = formatted_integer.upper()
-        elif format.primary == Formats.WORDS:
-            formatted_integer = DateTimeUtils.number_to_words(value, format.ordinal)
-            if format.case_type == TCase.UPPER:
+        elif fmt.primary == Formats.WORDS:
+            formatted_integer = DateTimeUtils.number_to_words(value, fmt.ordinal)
+            if fmt.case_type == TCase.UPPER:
                 formatted_integer = formatted_integer.upper()
-            elif format.case_type == TCase.LOWER:
-                formatted_integer = formatted_integer.casefold()
-        elif format.primary == Formats.DECIMAL:
-            formatted_integer = str(value)
-            pad_length = format.mandatoryDigits - len(formatted_integer)
-            if pad_length > 0:
-                formatted_integer = Functions.left_pad(
-                    formatted_integer, format.mandatoryDigits, "0"
+            elif fmt.case_type == TCase.LOWER:
+                formatted_integer = formatted_integer.lower()
+        elif fmt.primary == Formats.DECIMAL:
+            # value is non-negative here, so zfill only ever adds leading zeros
+            formatted_integer = str(value).zfill(fmt.mandatory_digits)
+            # ASCII digits (the common case) need no transliteration at all
+            if fmt.zero_code != 0x30:
+                formatted_integer = formatted_integer.translate(
+                    DateTimeUtils._digit_translations[fmt.zero_code]
                 )
-            if format.zeroCode != 0x30:
-                chars = list(formatted_integer)
-                i = 0
-                while i < len(chars):
-                    chars[i] = chr(ord(chars[i]) + format.zeroCode - 0x30)
-                    i += 1
-                formatted_integer = "".join(chars)
-            if format.regular:
-                n = int(
-                    (len(formatted_integer) - 1) / format.groupingSeparators[0].position
+            if fmt.regular:
+                position = fmt.grouping_separators[0].position
+                groups = [
+                    formatted_integer[max(0, end - position) : end]
+                    for end in range(len(formatted_integer), 0, -position)
+                ]
+                formatted_integer = fmt.grouping_separators[0].character.join(
+                    reversed(groups)
                 )
-                for i in range(n, 0, -1):
-                    pos = (
-                        len(formatted_integer)
-                        - i * format.groupingSeparators[0].position
-                    )
-                    formatted_integer = (
-                        formatted_integer[0:pos]
-                        + format.groupingSeparators[0].character
-                        + formatted_integer[pos:]
-                    )
             else:
-                format.groupingSeparators.reverse()
-                for separator in format.groupingSeparators:
-                    pos = len(formatted_integer) - separator.position
-                    formatted_integer = (
-                        formatted_integer[0:pos]
-                        + separator.character
-                        + formatted_integer[pos:]
-                    )
+                chars = list(formatted_integer)
+                for separator in reversed(fmt.grouping_separators):
+                    chars.insert(len(chars) - separator.position, separator.character)
+                formatted_integer = "".join(chars)
 
-            if format.ordinal:
-                last_digit = formatted_integer[len(formatted_integer) - 1 :]
-                suffix = DateTimeUtils._suffix123.get(last_digit)
+            if fmt.ordinal:
+                last_digit = formatted_integer[-1:]
+                suffix = _SUFFIX123.get(last_digit)
                 if suffix is None or (
-                    len(formatted_integer) > 1
-                    and formatted_integer[len(formatted_integer) - 2] == "1"
+                    len(formatted_integer) > 1 and formatted_integer[-2] == "1"
                 ):
                     suffix = "th"
                 formatted_integer += suffix
-        elif format.primary == Formats.SEQUENCE:
-            raise RuntimeError(
-                Constants.ERR_MSG_SEQUENCE_UNSUPPORTED.format(format.token)
-            )
+        elif fmt.primary == Formats.SEQUENCE:
+            raise RuntimeError(Constants.ERR_MSG_SEQUENCE_UNSUPPORTED.format(fmt.token))
         if negative:
             formatted_integer = "-" + formatted_integer
 
         return formatted_integer
 
+    # zero code points of the decimal digit groups, in ascending order
     _decimal_groups = [
         0x30,
         0x0660,
@@ -550,10 +523,19 @@ class DateTimeUtils:
         0xFF10,
     ]
 
+    # str.translate tables mapping ASCII digits onto each decimal group
+    _digit_translations = {
+        group: str.maketrans("0123456789", "".join(chr(group + i) for i in range(10)))
+        for group in _decimal_groups
+    }
+
     @staticmethod
+    @functools.lru_cache(maxsize=512)
     def _analyse_integer_picture(picture: Optional[str]) -> Format:
         """
         Analyse an integer format picture and return a Format object.
+        Results are cached and shared between callers, so callers that
+        need to adjust the returned Format must work on a copy.
         Args:
             picture (Optional[str]): The format picture.
         Returns:
@@ -595,52 +577,63 @@ class DateTimeUtils:
             optional_digits = 0
             grouping_separators = []
             separator_position = 0
-            format_codepoints = list(primary_format)
-            # ArrayUtils.reverse(format_codepoints)
-            for code_point in reversed(format_codepoints):
-                digit = False
-                i = 0
-                while i < len(DateTimeUtils._decimal_groups):
-                    group = DateTimeUtils._decimal_groups[i]
-                    if chr(group) <= code_point <= chr(group + 9):
-                        digit = True
-                        mandatory_digits += 1
-                        separator_position += 1
-                        if zero_code is None:
-                            zero_code = group
-                        elif group != zero_code:
-                            raise RuntimeError(Constants.ERR_MSG_DIFF_DECIMAL_GROUP)
-                        break
-                    i += 1
-                if not digit:
-                    if code_point == chr(0x23):
-                        separator_position += 1
-                        optional_digits += 1
-                    else:
-                        grouping_separators.append(
-                            GroupingSeparator(separator_position, code_point)
-                        )
+            # an ASCII picture can only contain digits from the ASCII group
+            ascii_only = primary_format.isascii()
+            for code_point in reversed(primary_format):
+                if ascii_only:
+                    group = 0x30 if "0" <= code_point <= "9" else None
+                else:
+                    group = DateTimeUtils._decimal_group(code_point)
+                if group is not None:
+                    mandatory_digits += 1
+                    separator_position += 1
+                    if zero_code is None:
+                        zero_code = group
+                    elif group != zero_code:
+                        raise RuntimeError(Constants.ERR_MSG_DIFF_DECIMAL_GROUP)
+                elif code_point == "#":
+                    separator_position += 1
+                    optional_digits += 1
+                else:
+                    grouping_separators.append(
+                        GroupingSeparator(separator_position, code_point)
+                    )
             if mandatory_digits > 0:
                 fmt.primary = Formats.DECIMAL
-                fmt.zeroCode = zero_code
-                fmt.mandatoryDigits = mandatory_digits
-                fmt.optionalDigits = optional_digits
+                fmt.zero_code = zero_code
+                fmt.mandatory_digits = mandatory_digits
+                fmt.optional_digits = optional_digits
 
                 regular = DateTimeUtils._get_regular_repeat(grouping_separators)
                 if regular > 0:
                     fmt.regular = True
-                    fmt.groupingSeparators.append(
+                    fmt.grouping_separators.append(
                         GroupingSeparator(regular, grouping_separators[0].character)
                     )
                 else:
                     fmt.regular = False
-                    fmt.groupingSeparators = grouping_separators
+                    fmt.grouping_separators = grouping_separators
             else:
                 fmt.primary = Formats.SEQUENCE
                 fmt.token = primary_format
 
         return fmt
 
+    @staticmethod
+    def _decimal_group(code_point: str) -> Optional[int]:
+        """
+        Find the decimal digit group a character belongs to.
+        Args:
+            code_point (str): The character to look up.
+        Returns:
+            Optional[int]: Zero code of the group, or None if not a decimal digit.
+        """
+        cp = ord(code_point)
+        i = bisect.bisect_right(DateTimeUtils._decimal_groups, cp) - 1
+        if i >= 0 and cp <= DateTimeUtils._decimal_groups[i] + 9:
+            return DateTimeUtils._decimal_groups[i]
+        return None
+
     @staticmethod
     def _get_regular_repeat(separators: Sequence["GroupingSeparator"]) -> int:
         """
@@ -654,61 +647,28 @@ class DateTimeUtils:
             return 0
 
         sep_char = separators[0].character
-        for i in range(1, len(separators)):
-            if separators[i].character is not sep_char:
-                return 0
+        if any(separator.character != sep_char for separator in separators):
+            return 0
 
-        indexes = [separator.position for separator in separators]
-        factor = int(functools.reduce(math.gcd, indexes))
-        for index in range(1, len(indexes) + 1):
-            if (
-                indexes.index(index * factor) if index * factor in indexes else -1
-            ) == -1:
+        indexes = {separator.position for separator in separators}
+        factor = functools.reduce(math.gcd, indexes)
+        for index in range(1, len(separators) + 1):
+            if index * factor not in indexes:
                 return 0
         return factor
 
     @staticmethod
-    def _create_default_presentation_modifiers() -> dict[str, str]:
-        """
-        Create default presentation modifiers for date/time components.
-        Returns:
-            dict[str, str]: Default modifiers mapping.
-        """
-        mapping = {
-            "Y": "1",
-            "M": "1",
-            "D": "1",
-            "d": "1",
-            "F": "n",
-            "W": "1",
-            "w": "1",
-            "X": "1",
-            "x": "1",
-            "H": "1",
-            "h": "1",
-            "P": "n",
-            "m": "01",
-            "s": "01",
-            "f": "1",
-            "Z": "01:01",
-            "z": "01:01",
-            "C": "n",
-            "E": "n",
-        }
-        return mapping
-
-    _default_presentation_modifiers = _create_default_presentation_modifiers.__func__()
-
-    @staticmethod
+    @functools.lru_cache(maxsize=256)
     def _analyse_datetime_picture(picture: str) -> PictureFormat:
         """
         Analyse a datetime format picture and return a PictureFormat object.
+        Results are cached, so the returned PictureFormat is frozen.
         Args:
             picture (str): The format picture.
         Returns:
             PictureFormat: Format specification object.
         """
-        fmt = PictureFormat()
+        fmt = PictureFormat("datetime")
         start = 0
         pos = 0
         while pos < len(picture):
@@ -717,7 +677,7 @@ class DateTimeUtils:
                 if picture[pos + 1] == "[":
                     # literal [
                     fmt.add_literal(picture, start, pos)
-                    fmt.parts.append(SpecPart("literal", value="["))
+                    fmt.parts.append(LiteralSpecPart("["))
                     pos += 2
                     start = pos
                     continue
@@ -727,7 +687,7 @@ class DateTimeUtils:
                 if pos == -1:
                     raise RuntimeError(Constants.ERR_MSG_NO_CLOSING_BRACKET)
                 marker = picture[start + 1 : pos]
-                marker = "".join(re.split("\\s+", marker))
+                marker = "".join(marker.split())
                 def_ = SpecPart("marker", component=marker[0])
                 comma = marker.rfind(",")
                 pres_mod = None
@@ -751,18 +711,16 @@ class DateTimeUtils:
                 if len(pres_mod) == 1:
                     def_.presentation1 = pres_mod
                 elif len(pres_mod) > 1:
-                    last_char = pres_mod[len(pres_mod) - 1]
-                    if "atco".find(last_char) != -1:
+                    last_char = pres_mod[-1]
+                    if last_char in _PRESENTATION2_CHARS:
                         def_.presentation2 = last_char
                         if last_char == "o":
                             def_.ordinal = True
-                        def_.presentation1 = pres_mod[0 : len(pres_mod) - 1]
+                        def_.presentation1 = pres_mod[:-1]
                     else:
                         def_.presentation1 = pres_mod
                 else:
-                    def_.presentation1 = DateTimeUtils._default_presentation_modifiers[
-                        def_.component
-                    ]
+                    def_.presentation1 = _DEFAULT_PRESENTATION_MODIFIERS[def_.component]
                 if def_.presentation1 is None:
                     raise RuntimeError(
                         Constants.ERR_MSG_UNKNOWN_COMPONENT_SPECIFIER.format(
@@ -776,38 +734,43 @@ class DateTimeUtils:
                         def_.names = TCase.TITLE
                     else:
                         def_.names = TCase.UPPER
-                elif "YMDdFWwXxHhmsf".find(def_.component) != -1:
+                elif def_.component in _INTEGER_COMPONENTS:
                     integer_pattern = def_.presentation1
                     if def_.presentation2 is not None:
                         integer_pattern += ";" + def_.presentation2
-                    def_.integerFormat = DateTimeUtils._analyse_integer_picture(
-                        integer_pattern
+                    def_.integerFormat = copy.copy(
+                        DateTimeUtils._analyse_integer_picture(integer_pattern)
                     )
                     def_.integerFormat.ordinal = def_.ordinal
                     if def_.width is not None and def_.width[0] is not None:
-                        if def_.integerFormat.mandatoryDigits < def_.width[0]:
-                            def_.integerFormat.mandatoryDigits = def_.width[0]
+                        if def_.integerFormat.mandatory_digits < def_.width[0]:
+                            def_.integerFormat.mandatory_digits = def_.width[0]
                     if def_.component == "Y":
                         def_.n = -1
                         if def_.width is not None and def_.width[1] is not None:
                             def_.n = def_.width[1]
-                            def_.integerFormat.mandatoryDigits = def_.n
+                            def_.integerFormat.mandatory_digits = def_.n
                         else:
                             w = (
-                                def_.integerFormat.mandatoryDigits
-                                + def_.integerFormat.optionalDigits
+                                def_.integerFormat.mandatory_digits
+                                + def_.integerFormat.optional_digits
                             )
                             if w >= 2:
                                 def_.n = w
+                        if def_.n != -1:
+                            def_.year_mod = 10**def_.n
                 if def_.component == "Z" or def_.component == "z":
-                    def_.integerFormat = DateTimeUtils._analyse_integer_picture(
-                        def_.presentation1
+                    def_.integerFormat = copy.copy(
+                        DateTimeUtils._analyse_integer_picture(def_.presentation1)
                     )
                     def_.integerFormat.ordinal = def_.ordinal
                 fmt.parts.append(def_)
                 start = pos + 1
             pos += 1
         fmt.add_literal(picture, start, pos)
+        for part in fmt.parts:
+            part.render = DateTimeUtils._compile_part(part)
+        fmt.freeze()
         return fmt
 
     @staticmethod
@@ -849,7 +812,25 @@ class DateTimeUtils:
         "December",
     ]
 
-    _iso8601_spec = None
+    _fragment_getters = {
+        "Y": lambda date: date.year,  # year
+        "M": lambda date: date.month,  # month in year
+        "D": lambda date: date.day,  # day in month
+        "d": lambda date: date.timetuple().tm_yday,  # day in year
+        "F": lambda date: date.isoweekday(),  # day of week
+        "W": lambda date: date.isocalendar().week,  # week in year
+        "w": lambda date: DateTimeUtils.week_in_month(date),  # week in month
+        "X": lambda date: DateTimeUtils.iso_week_numbering_year(date),
+        "x": lambda date: DateTimeUtils.iso_week_numbering_month(date),
+        "H": lambda date: date.hour,  # hour in day (24 hours)
+        "h": lambda date: (date.hour - 1) % 12 + 1,  # hour in day (12 hours)
+        "P": lambda date: "am" if date.hour < 12 else "pm",
+        "m": lambda date: date.minute,
+        "s": lambda date: date.second,
+        "f": lambda date: date.microsecond // 1000,
+        "C": lambda date: "ISO",
+        "E": lambda date: "ISO",
+    }
 
     @staticmethod
     def format_datetime(
@@ -869,194 +850,170 @@ class DateTimeUtils:
 
         if timezone is not None:
             offset = int(timezone)
-            offset_hours = math.trunc(offset / float(100))
-            offset_minutes = int(math.fmod(offset, 100))
-        format_spec = None
+            # split on the magnitude so both parts keep the sign of the offset
+            offset_hours, offset_minutes = divmod(abs(offset), 100)
+            if offset < 0:
+                offset_hours, offset_minutes = -offset_hours, -offset_minutes
+        offset_millis = (60 * offset_hours + offset_minutes) * 60 * 1000
+        date_time = _EPOCH + datetime.timedelta(milliseconds=millis + offset_millis)
         if picture is None:
-            if DateTimeUtils._iso8601_spec is None:
-                DateTimeUtils._iso8601_spec = DateTimeUtils._analyse_datetime_picture(
-                    "[Y0001]-[M01]-[D01]T[H01]:[m01]:[s01].[f001][Z01:01t]"
-                )
-            format_spec = DateTimeUtils._iso8601_spec
-        else:
-            format_spec = DateTimeUtils._analyse_datetime_picture(picture)
+            # [Y0001]-[M01]-[D01]T[H01]:[m01]:[s01].[f001][Z01:01t]
+            return (
+                f"{date_time.year:04d}-{date_time.month:02d}-{date_time.day:02d}"
+                f"T{date_time.hour:02d}:{date_time.minute:02d}"
+                f":{date_time.second:02d}.{date_time.microsecond // 1000:03d}"
+                + DateTimeUtils._format_iso8601_offset(offset_hours, offset_minutes)
+            )
 
-        offset_millis = (60 * offset_hours + offset_minutes) * 60 * 1000
-        date_time = datetime.datetime.fromtimestamp(
-            (millis + offset_millis) / 1000.0, datetime.timezone.utc
+        format_spec = DateTimeUtils._analyse_datetime_picture(picture)
+        return "".join(
+            [
+                part.render(date_time, offset_hours, offset_minutes)
+                for part in format_spec.parts
+            ]
         )
-        result = ""
-        for part in format_spec.parts:
-            if part.type == "literal":
-                result += part.value
-            else:
-                result += DateTimeUtils._format_component(
-                    date_time, part, offset_hours, offset_minutes
-                )
-
-        return result
 
     @staticmethod
-    def _format_component(
-        date: datetime.datetime,
-        marker_spec: SpecPart,
-        offset_hours: int,
-        offset_minutes: int,
-    ) -> str:
+    def _format_iso8601_offset(offset_hours: int, offset_minutes: int) -> str:
         """
-        Format a single component of a datetime value.
+        Format a timezone offset as the [Z01:01t] marker of the default picture.
         Args:
-            date (datetime.datetime): The datetime object.
-            marker_spec (SpecPart): Specification for the component.
             offset_hours (int): Timezone offset hours.
             offset_minutes (int): Timezone offset minutes.
         Returns:
-            str: Formatted component string.
+            str: "Z" for UTC, otherwise the signed offset as HH:MM.
         """
-        component_value = DateTimeUtils._get_datetime_fragment(
-            date, marker_spec.component
-        )
+        if offset_hours == 0 and offset_minutes == 0:
+            return "Z"
+        sign = "-" if offset_hours < 0 or offset_minutes < 0 else "+"
+        return f"{sign}{abs(offset_hours):02d}:{abs(offset_minutes):02d}"
 
-        if "YMDdFWwXxHhms".find(marker_spec.component) != -1:
-            if marker_spec.component == "Y":
-                if marker_spec.n != -1:
-                    component_value = str(
-                        int(
-                            (
-                                int(
-                                    math.fmod(
-                                        int(float(component_value)), 10**marker_spec.n
-                                    )
-                                )
-                            )
-                        )
-                    )
+    @staticmethod
+    def _compile_part(
+        marker_spec: Union[SpecPart, LiteralSpecPart],
+    ) -> Callable[[datetime.datetime, int, int], str]:
+        """
+        Build the function that renders a single part of a datetime picture.
+        The component dispatch is resolved once here instead of on every call.
+        Args:
+            marker_spec (Union[SpecPart, LiteralSpecPart]): Specification for the part.
+        Returns:
+            Callable[[datetime.datetime, int, int], str]: Renderer taking the
+            datetime, timezone offset hours and timezone offset minutes.
+        """
+        if marker_spec.type == "literal":
+            literal = marker_spec.value
+            return lambda date, offset_hours, offset_minutes: literal
+
+        component = marker_spec.component
+        integer_format = marker_spec.integerFormat
+        getter = DateTimeUtils._fragment_getters.get(component)
+
+        if component in _DATE_NAMED_COMPONENTS:
             if marker_spec.names is not None:
-                if marker_spec.component == "M" or marker_spec.component == "x":
-                    component_value = DateTimeUtils._months[
-                        int(float(component_value)) - 1
-                    ]
-                elif marker_spec.component == "F":
-                    component_value = DateTimeUtils._days[int(float(component_value))]
+                if component == "M" or component == "x":
+                    # months are 1-based, so pad index 0 like _days
+                    names = [""] + DateTimeUtils._months
+                elif component == "F":
+                    names = DateTimeUtils._days
                 else:
                     raise RuntimeError(
-                        Constants.ERR_MSG_INVALID_NAME_MODIFIER.format(
-                            marker_spec.component
-                        )
+                        Constants.ERR_MSG_INVALID_NAME_MODIFIER.format(component)
                     )
                 if marker_spec.names == TCase.UPPER:
-                    component_value = component_value.upper()
+                    names = [name.upper() for name in names]
                 elif marker_spec.names == TCase.LOWER:
-                    component_value = component_value.casefold()
-                if (
-                    marker_spec.width is not None
-                    and len(component_value) > marker_spec.width[1]
-                ):
-                    component_value = component_value[0 : marker_spec.width[1]]
-            else:
-                component_value = DateTimeUtils._format_integer(
-                    int(float(component_value)), marker_spec.integerFormat
-                )
-        elif marker_spec.component == "f":
-            component_value = DateTimeUtils._format_integer(
-                int(float(component_value)), marker_spec.integerFormat
-            )
-        elif marker_spec.component == "Z" or marker_spec.component == "z":
-            offset = offset_hours * 100 + offset_minutes
-            if marker_spec.integerFormat.regular:
-                component_value = DateTimeUtils._format_integer(
-                    offset, marker_spec.integerFormat
-                )
-            else:
-                num_digits = marker_spec.integerFormat.mandatoryDigits
-                if num_digits == 1 or num_digits == 2:
-                    component_value = DateTimeUtils._format_integer(
-                        offset_hours, marker_spec.integerFormat
+                    names = [name.lower() for name in names]
+                if marker_spec.width is not None:
+                    names = [name[: marker_spec.width[1]] for name in names]
+                marker_spec.name_table = tuple(names)
+                name_table = marker_spec.name_table
+                return lambda date, offset_hours, offset_minutes: name_table[
+                    getter(date)
+                ]
+
+            if component == "Y" and marker_spec.year_mod is not None:
+                year_mod = marker_spec.year_mod
+
+                def render_year(date, offset_hours, offset_minutes):
+                    return DateTimeUtils._format_integer(
+                        date.year % year_mod, integer_format
                     )
-                    if offset_minutes != 0:
-                        component_value += ":" + DateTimeUtils.format_integer(
-                            offset_minutes, "00"
-                        )
-                elif num_digits == 3 or num_digits == 4:
+
+                return render_year
+
+        if component in _INTEGER_COMPONENTS:
+
+            def render_integer(date, offset_hours, offset_minutes):
+                return DateTimeUtils._format_integer(getter(date), integer_format)
+
+            return render_integer
+
+        if component == "Z" or component == "z":
+            prefix = "GMT" if component == "z" else ""
+
+            def render_timezone(date, offset_hours, offset_minutes):
+                offset = offset_hours * 100 + offset_minutes
+                if integer_format.regular:
                     component_value = DateTimeUtils._format_integer(
-                        offset, marker_spec.integerFormat
+                        offset, integer_format
                     )
                 else:
-                    raise RuntimeError(Constants.ERR_MSG_TIMEZONE_FORMAT)
-            if offset >= 0:
-                component_value = "+" + component_value
-            if marker_spec.component == "z":
-                component_value = "GMT" + component_value
-            if (
-                offset == 0
-                and marker_spec.presentation2 is not None
-                and marker_spec.presentation2 == "t"
-            ):
-                component_value = "Z"
-        elif marker_spec.component == "P":
+                    num_digits = integer_format.mandatory_digits
+                    if num_digits == 1 or num_digits == 2:
+                        component_value = DateTimeUtils._format_integer(
+                            offset_hours, integer_format
+                        )
+                        if offset_minutes != 0:
+                            component_value = ":".join(
+                                (
+                                    component_value,
+                                    DateTimeUtils.format_integer(offset_minutes, "00"),
+                                )
+                            )
+                    elif num_digits == 3 or num_digits == 4:
+                        component_value = DateTimeUtils._format_integer(
+                            offset, integer_format
+                        )
+                    else:
+                        raise RuntimeError(Constants.ERR_MSG_TIMEZONE_FORMAT)
+                if offset == 0 and marker_spec.presentation2 == "t":
+                    return "Z"
+                return "".join((prefix, "+" if offset >= 0 else "", component_value))
+
+            return render_timezone
+
+        if component == "P" and marker_spec.names == TCase.UPPER:
             # §9.8.4.7 Formatting Other Components
             # Formatting P for am/pm
             # getDateTimeFragment() always returns am/pm lower case so check for UPPER here
-            if marker_spec.names == TCase.UPPER:
-                component_value = component_value.upper()
-        return component_value
+            return lambda date, offset_hours, offset_minutes: getter(date).upper()
+
+        return lambda date, offset_hours, offset_minutes: (
+            DateTimeUtils._get_datetime_fragment(date, component)
+        )
 
     @staticmethod
-    def _get_datetime_fragment(date: datetime.datetime, component: str) -> str:
+    def _get_datetime_fragment(
+        date: datetime.datetime, component: str
+    ) -> Union[int, str]:
         """
         Extract a fragment/component from a datetime object.
         Args:
             date (datetime.datetime): The datetime object.
             component (str): Component specifier.
         Returns:
-            str: Extracted value as string.
-        """
-        component_value = ""
-        if component == "Y":  # year
-            component_value = str(date.year)
-        elif component == "M":  # month in year
-            component_value = str(date.month)
-        elif component == "D":  # day in month
-            component_value = str(date.day)
-        elif component == "d":  # day in year
-            component_value = str(date.timetuple().tm_yday)
-        elif component == "F":  # day of week
-            component_value = str(date.isoweekday())
-        elif component == "W":  # week in year
-            component_value = str(date.isocalendar().week)
-        elif component == "w":  # week in month
-            component_value = str(DateTimeUtils.week_in_month(date))
-        elif component == "X":
-            component_value = str(DateTimeUtils.iso_week_numbering_year(date))
-        elif component == "x":
-            component_value = str(DateTimeUtils.iso_week_numbering_month(date))
-        elif component == "H":  # hour in day (24 hours)
-            component_value = str(date.hour)
-        elif component == "h":  # hour in day (12 hours)
-            hour = date.hour
-            if hour > 12:
-                hour -= 12
-            elif hour == 0:
-                hour = 12
-            component_value = str(hour)
-        elif component == "P":
-            component_value = "am" if date.hour < 12 else "pm"
-        elif component == "m":
-            component_value = str(date.minute)
-        elif component == "s":
-            component_value = str(date.second)
-        elif component == "f":
-            component_value = str(date.microsecond / 1000.0)
-        elif component == "Z" or component == "z":
-
+            Union[int, str]: Extracted value; numeric components are ints,
+            "P" gives "am"/"pm" and "C"/"E" give "ISO".
+        """
+        getter = DateTimeUtils._fragment_getters.get(component)
+        if getter is not None:
+            return getter(date)
+        if component == "Z" or component == "z":
             logging.warning(
                 "Component %s not implemented for date extraction.", component
             )
-        elif component == "C":
-            component_value = "ISO"
-        elif component == "E":
-            component_value = "ISO"
-        return component_value
+        return ""
 
     @staticmethod
     def week_in_month(dt: datetime.datetime) -> int:
@@ -1069,7 +1026,7 @@ class DateTimeUtils:
         """
         this_month = YearMonth(dt.year, dt.month)
         start_of_week1 = DateTimeUtils.start_of_first_week(this_month)
-        today = datetime.date(this_month.year, this_month.month, dt.day)
+        today = dt.date()
         week = DateTimeUtils.delta_weeks(start_of_week1, today)
         if week > 4:
             start_of_following_month = DateTimeUtils.start_of_first_week(
@@ -1082,7 +1039,7 @@ class DateTimeUtils:
                 this_month.previous_month()
             )
             week = DateTimeUtils.delta_weeks(start_of_previous_month, today)
-        return math.floor(week)
+        return week
 
     @staticmethod
     def iso_week_numbering_year(dt: datetime.datetime) -> int:
@@ -1096,7 +1053,7 @@ class DateTimeUtils:
         this_year = YearMonth(dt.year, 1)
         start_of_iso_year = DateTimeUtils.start_of_first_week(this_year)
         end_of_iso_year = DateTimeUtils.start_of_first_week(this_year.next_year())
-        now = datetime.date(dt.year, dt.month, dt.day)
+        now = dt.date()
         if now < start_of_iso_year:
             return this_year.year - 1
         elif now >= end_of_iso_year:
@@ -1117,7 +1074,7 @@ class DateTimeUtils:
         start_of_iso_month = DateTimeUtils.start_of_first_week(this_month)
         next_month = this_month.next_month()
         end_of_iso_month = DateTimeUtils.start_of_first_week(next_month)
-        now = datetime.date(dt.year, dt.month, dt.day)
+        now = dt.date()
         if now < start_of_iso_month:
             return this_month.previous_month().month
         if now >= end_of_iso_month:
@@ -1133,18 +1090,30 @@ class DateTimeUtils:
         Returns:
             datetime.date: Start date of first week.
         """
+        return DateTimeUtils._start_of_first_week(year_month.year, year_month.month)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=2048)
+    def _start_of_first_week(year: int, month: int) -> datetime.date:
+        """
+        Calculate the start date of the first ISO week, cached per year/month.
+        Args:
+            year (int): Year.
+            month (int): Month (1-12).
+        Returns:
+            datetime.date: Start date of first week.
+        """
         # ISO 8601 defines the first week of the year to be the week that contains the first Thursday
         # XPath F&O extends this same definition for the first week of a month
         # the week starts on a Monday - calculate the millis for the start of the first week
         # millis for given 1st Jan of that year (at 00:00 UTC)
-        jan1 = datetime.date(year_month.year, year_month.month, 1)
-        day_of_jan1 = jan1.isoweekday()
-        # if Jan 1 is Fri, Sat or Sun, then add the number of days ( in millis) to jan1 to get the start of week 1
-        return (
-            jan1 + datetime.timedelta(days=8 - day_of_jan1)
-            if day_of_jan1 > 4
-            else jan1 - datetime.timedelta(days=day_of_jan1 - 1)
-        )
+        jan1 = datetime.date(year, month, 1).toordinal()
+        # ordinal 1 is Monday 0001-01-01, so this is the ISO day of the week
+        day_of_jan1 = (jan1 - 1) % 7 + 1
+        # if Jan 1 is Fri, Sat or Sun, then add the number of days to jan1 to get the start of week 1
+        if day_of_jan1 > 4:
+            return datetime.date.fromordinal(jan1 + 8 - day_of_jan1)
+        return datetime.date.fromordinal(jan1 - day_of_jan1 + 1)
 
     @staticmethod
     def delta_weeks(start: datetime.date, end: datetime.date) -> int:
@@ -1156,7 +1125,7 @@ class DateTimeUtils:
         Returns:
             int: Number of weeks.
         """
-        return int((end - start).total_seconds() / (7 * 24 * 60 * 60) + 1)
+        return (end.toordinal() - start.toordinal()) // 7 + 1
 
     @staticmethod
     def parse_datetime(timestamp: Optional[str], picture: str) -> Optional[int]:
@@ -1168,13 +1137,7 @@ class DateTimeUtils:
         Returns:
             Optional[int]: Milliseconds since epoch or None.
         """
-        format_spec = DateTimeUtils._analyse_datetime_picture(picture)
-        match_spec = DateTimeUtils._generate_regex(format_spec)
-        full_regex = "^"
-        for part in match_spec.parts:
-            full_regex += "(" + part.regex + ")"
-        full_regex += "$"
-        pattern = re.compile(full_regex, re.IGNORECASE)
+        match_spec, pattern = DateTimeUtils._compile_parser(picture)
         match = pattern.search(timestamp)
         if match is not None:
             dm_a = 161
@@ -1200,27 +1163,20 @@ class DateTimeUtils:
                 # nothing specified
                 return None
 
-            mask = 0
-
-            for part in "YXMxWwdD":
-                mask <<= 1
-                if components.get(part) is not None:
-                    mask += 1
-            date_a = DateTimeUtils._is_type(dm_a, mask)
-            date_b = not date_a and DateTimeUtils._is_type(dm_b, mask)
-            date_c = DateTimeUtils._is_type(dm_c, mask)
-            date_d = not date_c and DateTimeUtils._is_type(dm_d, mask)
-
-            mask = 0
-            for part in "PHhmsf":
-                mask <<= 1
-                if components.get(part) is not None:
-                    mask += 1
+            is_type = DateTimeUtils._is_type
+            specified = [
+                part for part, value in components.items() if value is not None
+            ]
 
-                logging.debug("Checked part %s for mask calculation.", part)
+            mask = sum(_DATE_MASK_BITS.get(part, 0) for part in specified)
+            date_a = is_type(dm_a, mask)
+            date_b = not date_a and is_type(dm_b, mask)
+            date_c = is_type(dm_c, mask)
+            date_d = not date_c and is_type(dm_d, mask)
 
-            time_a = DateTimeUtils._is_type(tm_a, mask)
-            time_b = not time_a and DateTimeUtils._is_type(tm_b, mask)
+            mask = sum(_TIME_MASK_BITS.get(part, 0) for part in specified)
+            time_a = is_type(tm_a, mask)
+            time_b = not time_a and is_type(tm_b, mask)
 
             date_comps = (
                 "YB" if date_b else "XxwF" if date_c else "XWF" if date_d else "YMD"
@@ -1235,11 +1191,11 @@ class DateTimeUtils:
             for part in comps:
                 if components.get(part) is None:
                     if start_specified:
-                        components[part] = 1 if "MDd".find(part) != -1 else 0
+                        components[part] = 1 if part in _ONE_BASED_COMPONENTS else 0
                         end_specified = True
                     else:
-                        components[part] = int(
-                            float(DateTimeUtils._get_datetime_fragment(now, part))
+                        components[part] = DateTimeUtils._get_datetime_fragment(
+                            now, part
                         )
                 else:
                     start_specified = True
@@ -1284,6 +1240,22 @@ class DateTimeUtils:
             return int(millis)
         return None
 
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _compile_parser(picture: str) -> tuple["PictureMatcher", re.Pattern]:
+        """
+        Build the matcher and compiled regex for a datetime picture.
+        The result is cached per picture; the matcher parts are not mutated.
+        Args:
+            picture (str): Format picture.
+        Returns:
+            tuple[PictureMatcher, re.Pattern]: Matcher and compiled regex.
+        """
+        format_spec = DateTimeUtils._analyse_datetime_picture(picture)
+        match_spec = DateTimeUtils._generate_regex(format_spec)
+        full_regex = "^" + "".join(f"({part.regex})" for part in match_spec.parts) + "$"
+        return match_spec, re.compile(full_regex, re.IGNORECASE)
+
     @staticmethod
     def _is_type(type_code: int, mask: int) -> bool:
         """
@@ -1309,13 +1281,10 @@ class DateTimeUtils:
         for part in format_spec.parts:
             res = None
             if part.type == "literal":
-                p = re.compile("[.*+?^${}()|\\[\\]\\\\]")
-
-                regex = re.sub(p, r"\g<0>", part.value)
-                res = MatcherPart(regex)
+                res = MatcherPart(re.escape(part.value))
             elif part.component == "Z" or part.component == "z":
                 separator = (
-                    len(part.integerFormat.groupingSeparators) == 1
+                    len(part.integerFormat.grouping_separators) == 1
                     and part.integerFormat.regular
                 )
                 regex = ""
@@ -1324,7 +1293,7 @@ class DateTimeUtils:
                 regex += "[-+][0-9]+"
                 if separator:
                     regex += (
-                        part.integerFormat.groupingSeparators[0].character + "[0-9]+"
+                        part.integerFormat.grouping_separators[0].character + "[0-9]+"
                     )
                 res = MatcherPartTimeZone(regex, part, separator)
             elif part.integerFormat is not None:
@@ -1333,37 +1302,37 @@ class DateTimeUtils:
                 )
             else:
                 regex = "[a-zA-Z]+"
-                lookup = {}
-                if part.component == "M" or part.component == "x":
-                    i = 0
-                    while i < len(DateTimeUtils._months):
-                        if part.width is not None and part.width[1] is not None:
-                            lookup[DateTimeUtils._months[i][0 : part.width[1]]] = i + 1
-                        else:
-                            lookup[DateTimeUtils._months[i]] = i + 1
-                        i += 1
-                elif part.component == "F":
-                    i = 1
-                    while i < len(DateTimeUtils._days):
-                        if part.width is not None and part.width[1] is not None:
-                            lookup[DateTimeUtils._days[i][0 : part.width[1]]] = i
-                        else:
-                            lookup[DateTimeUtils._days[i]] = i
-                        i += 1
-                elif part.component == "P":
-                    lookup["am"] = 0
-                    lookup["AM"] = 0
-                    lookup["pm"] = 1
-                    lookup["PM"] = 1
-                else:
+                if part.component not in ("M", "x", "F", "P"):
                     raise RuntimeError(
                         Constants.ERR_MSG_INVALID_NAME_MODIFIER.format(part.component)
                     )
+                max_width = part.width[1] if part.width is not None else None
+                lookup = DateTimeUtils._name_lookup(part.component, max_width)
                 res = MatcherPartLookup(regex, lookup)
             res.component = part.component
             matcher.parts.append(res)
         return matcher
 
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _name_lookup(component: str, max_width: Optional[int]) -> dict[str, int]:
+        """
+        Build the name-to-value table for a named component, shared between matchers.
+        The returned dict is cached and must not be modified.
+        Args:
+            component (str): Component specifier (M, x, F or P).
+            max_width (Optional[int]): Maximum name width, or None for full names.
+        Returns:
+            dict[str, int]: Mapping of (truncated) names to component values.
+        """
+        if component == "P":
+            return {"am": 0, "AM": 0, "pm": 1, "PM": 1}
+        if component == "F":
+            names = enumerate(DateTimeUtils._days[1:], 1)
+        else:
+            names = enumerate(DateTimeUtils._months, 1)
+        return {name[:max_width]: value for value, name in names}
+
     @staticmethod
     def _generate_regex_with_component(
         component: Optional[str], format_spec: Optional[Format]
@@ -1384,7 +1353,7 @@ class DateTimeUtils:
             regex = "[MDCLXVI]+" if is_upper else "[mdclxvi]+"
             matcher = MatcherPartRoman(regex, is_upper)
         elif format_spec.primary == Formats.WORDS:
-            words = set(DateTimeUtils._word_values.keys())
+            words = set(_WORD_VALUES.keys())
             words.add("and")
             words.add("[\\-, ]")
             regex = "(?:" + "|".join(words) + ")+"
@@ -1421,13 +1390,38 @@ class DateTimeUtils:
         Returns:
             int: Decimal value.
         """
+        # Horner's scheme: a=1 ... z=26, most significant letter first
+        base = ord(a_char) - 1
         decimal = 0
-        chars = list(letters)
-        i = 0
-        while i < len(chars):
-            decimal += (ord(chars[len(chars) - i - 1]) - ord(a_char) + 1) * 26**i
-            i += 1
+        for code in letters.encode("ascii"):
+            decimal = decimal * 26 + code - base
         return decimal
 
 
-# Removed access to protected member
+def _build_word_values() -> dict[str, int]:
+    """
+    Build the mapping of lower case number words to their values.
+    Returns:
+        dict[str, int]: Word value mapping.
+    """
+    word_values = {}
+    for i, word in enumerate(DateTimeUtils._few):
+        word_values[word.casefold()] = i
+    for i, word in enumerate(DateTimeUtils._ordinals):
+        word_values[word.casefold()] = i
+    for i, word in enumerate(DateTimeUtils._decades):
+        lword = word.casefold()
+        word_values[lword] = (i + 2) * 10
+        word_values[lword[:-1] + "ieth"] = word_values[lword]
+    word_values["hundredth"] = 100
+    word_values["hundreth"] = 100
+    for i, word in enumerate(DateTimeUtils._magnitudes):
+        lword = word.casefold()
+        val = 10 ** ((i + 1) * 3)
+        word_values[lword] = val
+        word_values[lword + "th"] = val
+    # the derived keys are fresh strings; intern them like the literals they mirror
+    return {sys.intern(word): value for word, value in word_values.items()}
+
+
+_WORD_VALUES = _build_word_values()
@@ -51,13 +51,13 @@ class Format:
 
     type: str
     primary: "Formats"
-    caseType: "TCase"
+    case_type: "TCase"
     ordinal: bool
-    zeroCode: int
-    mandatoryDigits: int
-    optionalDigits: int
+    zero_code: int
+    mandatory_digits: int
+    optional_digits: int
     regular: bool
-    groupingSeparators: list["GroupingSeparator"]
+    grouping_separators: list["GroupingSeparator"]
     token: Optional[str]
 
     def __init__(self):
@@ -68,9 +68,9 @@ class Format:
         self.primary = Formats.DECIMAL
         self.case_type = TCase.LOWER
         self.ordinal = False
-        self.zeroCode = 0
-        self.mandatoryDigits = 0
-        self.optionalDigits = 0
+        self.zero_code = 0
+        self.mandatory_digits = 0
+        self.optional_digits = 0
         self.regular = False
-        self.groupingSeparators = []
+        self.grouping_separators = []
         self.token = None
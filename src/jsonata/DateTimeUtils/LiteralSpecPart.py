@@ -0,0 +1,65 @@
+# Copyright Robert Yokota
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Derived from the following code:
+#
+#   Project name: jsonata-java
+#   Copyright Dashjoin GmbH. https://dashjoin.com
+#   Licensed under the Apache License, Version 2.0 (the "License")
+#
+#   Project name: JSONata4Java
+#   (c) Copyright 2018, 2019 IBM Corporation
+#   Licensed under the Apache License, Version 2.0 (the "License")
+#   1 New Orchard Road,
+#   Armonk, New York, 10504-1722
+#   United States
+#   +1 914 499 1900
+#   support: Nathaniel Mills wnm3@us.ibm.com
+#
+
+# pylint: disable=locally-disabled, multiple-statements, fixme, line-too-long
+
+"""
+LiteralSpecPart module for JSONata Python implementation.
+Provides a lightweight part for literal text in date/time picture format specifications.
+Adapted from jsonata-java and JSONata4Java projects.
+"""
+
+
+import datetime
+from typing import Callable, Optional
+
+
+class LiteralSpecPart:
+    """
+    Represents literal text in a picture format specification for date/time formatting.
+    Carries only the text, unlike the marker SpecPart with its presentation details.
+    """
+
+    __slots__ = ("value", "render")
+
+    type = "literal"
+    component = None
+
+    value: str
+    render: "Optional[Callable[[datetime.datetime, int, int], str]]"
+
+    def __init__(self, value):
+        """
+        Initialize a LiteralSpecPart with its text.
+        Args:
+            value (str): The literal text.
+        """
+        self.value = value
+        self.render = None
@@ -45,6 +45,8 @@ class MatcherPart:
     Represents a part of a regex matcher for date/time or number parsing in Jsonata.
     """
 
+    __slots__ = ("regex", "component")
+
     regex: str
     component: Optional[str]
 
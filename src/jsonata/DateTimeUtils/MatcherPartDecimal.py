@@ -37,16 +37,39 @@ Adapted from jsonata-java and JSONata4Java projects.
 """
 
 
+import functools
+from typing import Callable, Optional
+
 from src.jsonata.DateTimeUtils.Format import Format
 from src.jsonata.DateTimeUtils.MatcherPart import MatcherPart
 
 
+@functools.lru_cache(maxsize=128)
+def _make_translation(zero_code: int, separators: str) -> dict[int, Optional[int]]:
+    """
+    Build the str.translate table shared by decimal matchers with the same
+    digit family and grouping separators. The returned dict must not be modified.
+    Args:
+        zero_code (int): Code point of the zero digit.
+        separators (str): Grouping separator characters to delete.
+    Returns:
+        dict[int, Optional[int]]: Translation table (empty if nothing to do).
+    """
+    digits = ""
+    if zero_code != 0x30:
+        digits = "".join(chr(zero_code + i) for i in range(10))
+    return str.maketrans(digits, "0123456789" if digits else "", separators)
+
+
 class MatcherPartDecimal(MatcherPart):
     """
     Matcher part for decimal numbers, supporting formatting and parsing.
     """
 
+    __slots__ = ("_format_spec", "_parse_digits")
+
     _format_spec: "Format"
+    _parse_digits: Callable[[str], int]
 
     def __init__(self, regex, format_spec):
         """
@@ -57,6 +80,23 @@ class MatcherPartDecimal(MatcherPart):
         """
         super().__init__(regex)
         self._format_spec = format_spec
+        if format_spec.regular:
+            separators = ","
+        else:
+            separators = "".join(
+                sep.character for sep in format_spec.grouping_separators
+            )
+        # one pass that drops grouping separators and maps digits to ASCII
+        translation = _make_translation(format_spec.zero_code, separators)
+        # specialise once so parse only does the work this format needs
+        if format_spec.ordinal and translation:
+            self._parse_digits = lambda value: int(value[:-2].translate(translation))
+        elif format_spec.ordinal:
+            self._parse_digits = lambda value: int(value[:-2])
+        elif translation:
+            self._parse_digits = lambda value: int(value.translate(translation))
+        else:
+            self._parse_digits = int
 
     def parse(self, value: str) -> int:
         """
@@ -66,19 +106,4 @@ class MatcherPartDecimal(MatcherPart):
         Returns:
             int: Parsed integer value.
         """
-        digits = value
-        if self._format_spec.ordinal:
-            digits = value[0 : len(value) - 2]
-        if self._format_spec.regular:
-            digits = "".join(digits.split(","))
-        else:
-            for sep in self._format_spec.groupingSeparators:
-                digits = "".join(digits.split(sep.character))
-        if self._format_spec.zeroCode != 0x30:
-            chars = list(digits)
-            i = 0
-            while i < len(chars):
-                chars[i] = chr(ord(chars[i]) - self._format_spec.zeroCode + 0x30)
-                i += 1
-            digits = "".join(chars)
-        return int(digits)
+        return self._parse_digits(value)
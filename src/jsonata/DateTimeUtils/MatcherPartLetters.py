@@ -45,7 +45,10 @@ class MatcherPartLetters(MatcherPart):
     Matcher part for alphabetic letter sequences, supporting upper/lower case.
     """
 
+    __slots__ = ("_is_upper", "_a_char")
+
     _is_upper: bool
+    _a_char: str
 
     def __init__(self, regex, is_upper):
         """
@@ -56,6 +59,7 @@ class MatcherPartLetters(MatcherPart):
         """
         super().__init__(regex)
         self._is_upper = is_upper
+        self._a_char = "A" if is_upper else "a"
 
     def parse(self, value: str) -> int:
         """
@@ -67,4 +71,4 @@ class MatcherPartLetters(MatcherPart):
         """
         from src.jsonata.DateTimeUtils.DateTimeUtils import DateTimeUtils
 
-        return DateTimeUtils.letters_to_decimal(value, "A" if self._is_upper else "a")
+        return DateTimeUtils.letters_to_decimal(value, self._a_char)
@@ -45,6 +45,8 @@ class MatcherPartLookup(MatcherPart):
     Matcher part for lookup-based parsing, using a dictionary to map values.
     """
 
+    __slots__ = ("_lookup",)
+
     _lookup: dict[str, int]
 
     def __init__(self, regex, lookup):
@@ -37,8 +37,13 @@ Adapted from jsonata-java and JSONata4Java projects.
 """
 
 
+from typing import Optional
+
 from src.jsonata.DateTimeUtils.MatcherPart import MatcherPart
 
+# Roman numerals are ASCII, so a small table is enough to upper-case them
+_ROMAN_UPPER = str.maketrans("ivxlcdm", "IVXLCDM")
+
 
 class MatcherPartRoman(MatcherPart):
     """
@@ -46,15 +51,32 @@ class MatcherPartRoman(MatcherPart):
     Converts Roman numeral strings to decimal integers, with case sensitivity.
     """
 
+    __slots__ = ("_is_upper", "_to_upper")
+
     _is_upper: bool
+    _to_upper: Optional[dict[int, int]]
 
     def __init__(self, regex, is_upper):
+        """
+        Initialize a MatcherPartRoman with regex and case type.
+        Args:
+            regex (str): Regex pattern for matching Roman numerals.
+            is_upper (bool): True if matching uppercase numerals, False for lowercase.
+        """
         super().__init__(regex)
         self._is_upper = is_upper
+        self._to_upper = None if is_upper else _ROMAN_UPPER
 
     def parse(self, value: str) -> int:
+        """
+        Parse a Roman numeral into its decimal value.
+        Args:
+            value (str): The Roman numeral to parse.
+        Returns:
+            int: Parsed decimal value.
+        """
         from src.jsonata.DateTimeUtils.DateTimeUtils import DateTimeUtils
 
-        return DateTimeUtils.roman_to_decimal(
-            value if self._is_upper else value.upper()
-        )
+        if self._to_upper is not None:
+            value = value.translate(self._to_upper)
+        return DateTimeUtils.roman_to_decimal(value)
@@ -37,6 +37,8 @@ Adapted from jsonata-java and JSONata4Java projects.
 """
 
 
+from typing import Optional
+
 from src.jsonata.DateTimeUtils.MatcherPart import MatcherPart
 from src.jsonata.DateTimeUtils.SpecPart import SpecPart
 
@@ -46,8 +48,12 @@ class MatcherPartTimeZone(MatcherPart):
     Matcher part for parsing time zone offsets from date/time strings.
     """
 
+    __slots__ = ("_part", "_separator", "_sep_char", "_prefix_len")
+
     _part: "SpecPart"
     _separator: bool
+    _sep_char: Optional[str]
+    _prefix_len: int
 
     def __init__(self, regex, part, separator):
         """
@@ -60,6 +66,11 @@ class MatcherPartTimeZone(MatcherPart):
         super().__init__(regex)
         self._part = part
         self._separator = separator
+        self._sep_char = (
+            part.integerFormat.grouping_separators[0].character if separator else None
+        )
+        # [z] offsets are preceded by "GMT"
+        self._prefix_len = 3 if part.component == "z" else 0
 
     def parse(self, value: str) -> int:
         """
@@ -69,29 +80,11 @@ class MatcherPartTimeZone(MatcherPart):
         Returns:
             int: Offset in minutes.
         """
-        if self._part.component == "z":
-            value = value[3:]
-        offset_hours = 0
-        offset_minutes = 0
+        value = value[self._prefix_len :]
         if self._separator:
-            offset_hours = int(
-                value[
-                    0 : value.find(
-                        self._part.integerFormat.groupingSeparators[0].character
-                    )
-                ]
-            )
-            offset_minutes = int(
-                value[
-                    value.find(self._part.integerFormat.groupingSeparators[0].character)
-                    + 1 :
-                ]
-            )
-        else:
-            numdigits = len(value) - 1
-            if numdigits <= 2:
-                offset_hours = int(value)
-            else:
-                offset_hours = int(value[0:3])
-                offset_minutes = int(value[3:])
-        return offset_hours * 60 + offset_minutes
+            hours, _, minutes = value.partition(self._sep_char)
+            return int(hours) * 60 + int(minutes)
+        # sign plus at most two digits is hours only
+        if len(value) <= 3:
+            return int(value) * 60
+        return int(value[:3]) * 60 + int(value[3:])
@@ -45,6 +45,8 @@ class MatcherPartWords(MatcherPart):
     Matcher part for parsing numbers expressed as words (e.g., 'one hundred').
     """
 
+    __slots__ = ()
+
     def parse(self, value: str) -> int:
         """
         Parse a number expressed as words into its integer value.
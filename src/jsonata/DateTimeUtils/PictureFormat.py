@@ -37,25 +37,46 @@ Adapted from jsonata-java and JSONata4Java projects.
 """
 
 
+from typing import Union
+
+from src.jsonata.DateTimeUtils.LiteralSpecPart import LiteralSpecPart
 from src.jsonata.DateTimeUtils.SpecPart import SpecPart
 
 
 class PictureFormat:
     """
     Represents a parsed picture format for date/time formatting in Jsonata.
-    Holds a list of SpecPart objects describing the format.
+    Holds a list of SpecPart and LiteralSpecPart objects describing the format.
     """
 
+    __slots__ = ("type", "parts", "_frozen")
+
     type: str
-    parts: list["SpecPart"]
+    parts: list[Union["SpecPart", "LiteralSpecPart"]]
 
-    def __init__(self):
+    def __init__(self, format_type: str = ""):
         """
-        Initialize a PictureFormat object with default type and empty parts list.
+        Initialize a PictureFormat object with a type and empty parts list.
+        Args:
+            format_type (str): The kind of picture, e.g. 'datetime'.
         """
-        self.type = type
+        self._frozen = False
+        self.type = format_type
         self.parts = []
 
+    def __setattr__(self, name, value):
+        if getattr(self, "_frozen", False):
+            raise AttributeError(f"PictureFormat is frozen, cannot set {name}")
+        super().__setattr__(name, value)
+
+    def freeze(self) -> None:
+        """
+        Make the picture format read-only so it can be shared between callers.
+        The parts list is converted to a tuple and further assignments raise.
+        """
+        self.parts = tuple(self.parts)
+        self._frozen = True
+
     def add_literal(self, picture: str, start: int, end: int) -> None:
         """
         Add a literal part to the picture format.
@@ -65,10 +86,6 @@ class PictureFormat:
             end (int): End index of the literal.
         """
         if end > start:
-            literal = picture[start:end]
-            if literal == "]]":
-                # handle special case where picture ends with ]], split yields empty array
-                literal = "]"
-            else:
-                literal = "]".join(literal.split("]]"))
-            self.parts.append(SpecPart("literal", value=literal))
+            # ]] is an escaped ]
+            literal = picture[start:end].replace("]]", "]")
+            self.parts.append(LiteralSpecPart(literal))
@@ -46,6 +46,8 @@ class PictureMatcher:
     Used for matching and parsing date/time strings in Jsonata.
     """
 
+    __slots__ = ("parts",)
+
     parts: list["MatcherPart"]
 
     def __init__(self):
@@ -42,6 +42,8 @@ class RomanNumeral:
     Represents a Roman numeral with its integer value and letter representation.
     """
 
+    __slots__ = ("_value", "_letters")
+
     _value: int
     _letters: str
 
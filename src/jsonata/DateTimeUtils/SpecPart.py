@@ -37,7 +37,8 @@ Adapted from jsonata-java and JSONata4Java projects.
 """
 
 
-from typing import Optional
+import datetime
+from typing import Callable, Optional
 
 from src.jsonata.DateTimeUtils.TCase import TCase
 from src.jsonata.DateTimeUtils.Format import Format
@@ -49,6 +50,22 @@ class SpecPart:
     Holds details about type, component, value, width, presentation, and formatting.
     """
 
+    __slots__ = (
+        "type",
+        "value",
+        "component",
+        "width",
+        "presentation1",
+        "presentation2",
+        "ordinal",
+        "names",
+        "integerFormat",
+        "n",
+        "year_mod",
+        "name_table",
+        "render",
+    )
+
     type: str
     value: Optional[str]
     component: str
@@ -59,6 +76,9 @@ class SpecPart:
     names: "Optional[TCase]"
     integerFormat: "Optional[Format]"
     n: int
+    year_mod: Optional[int]
+    name_table: Optional[tuple[str, ...]]
+    render: "Optional[Callable[[datetime.datetime, int, int], str]]"
 
     def __init__(self, part_type, component=None, value=None):
         """
@@ -79,3 +99,6 @@ class SpecPart:
         self.names = None
         self.integerFormat = None
         self.n = 0
+        self.year_mod = None
+        self.name_table = None
+        self.render = None
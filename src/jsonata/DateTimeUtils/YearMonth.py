@@ -37,17 +37,59 @@ Adapted from jsonata-java and JSONata4Java projects.
 """
 
 
-from dataclasses import dataclass
-
-
-@dataclass
 class YearMonth:
     """
     Represents a year and month, with utility methods for navigation.
+    The pair is packed into a single month count so navigation is plain arithmetic.
     """
 
-    year: int
-    month: int
+    __slots__ = ("_k",)
+
+    _k: int
+
+    def __init__(self, year: int, month: int):
+        """
+        Initialize a YearMonth.
+        Args:
+            year (int): The year.
+            month (int): The month (1-12).
+        """
+        self._k = year * 12 + (month - 1)
+
+    @classmethod
+    def _from_key(cls, k: int) -> "YearMonth":
+        """
+        Build a YearMonth directly from its packed month count.
+        Args:
+            k (int): year * 12 + (month - 1).
+        Returns:
+            YearMonth: The corresponding YearMonth.
+        """
+        obj = cls.__new__(cls)
+        obj._k = k
+        return obj
+
+    @property
+    def year(self) -> int:
+        """
+        The year.
+        """
+        return self._k // 12
+
+    @property
+    def month(self) -> int:
+        """
+        The month (1-12).
+        """
+        return self._k % 12 + 1
+
+    def __eq__(self, other):
+        if other.__class__ is self.__class__:
+            return self._k == other._k
+        return NotImplemented
+
+    def __repr__(self):
+        return f"YearMonth(year={self.year}, month={self.month})"
 
     def next_month(self):
         """
@@ -55,11 +97,7 @@ class YearMonth:
         Returns:
             YearMonth: The next month.
         """
-        return (
-            YearMonth(self.year + 1, 1)
-            if self.month == 12
-            else YearMonth(self.year, self.month + 1)
-        )
+        return YearMonth._from_key(self._k + 1)
 
     def previous_month(self):
         """
@@ -67,11 +105,7 @@ class YearMonth:
         Returns:
             YearMonth: The previous month.
         """
-        return (
-            YearMonth(self.year - 1, 12)
-            if self.month == 1
-            else YearMonth(self.year, self.month - 1)
-        )
+        return YearMonth._from_key(self._k - 1)
 
     def next_year(self):
         """
@@ -79,7 +113,7 @@ class YearMonth:
         Returns:
             YearMonth: The next year.
         """
-        return YearMonth(self.year + 1, self.month)
+        return YearMonth._from_key(self._k + 12)
 
     def previous_year(self):
         """
@@ -87,4 +121,4 @@ class YearMonth:
         Returns:
             YearMonth: The previous year.
         """
-        return YearMonth(self.year - 1, self.month)
+        return YearMonth._from_key(self._k - 12)
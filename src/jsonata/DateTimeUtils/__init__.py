@@ -1,12 +1,46 @@
-import os
-import glob
+"""
+DateTimeUtils subpackage initialization for Jsonata Python implementation.
+Imports the date/time and integer picture formatting modules.
+"""
 
-__all__ = []
+from src.jsonata.DateTimeUtils import (
+    DateTimeUtils,
+    Format,
+    Formats,
+    GroupingSeparator,
+    LiteralSpecPart,
+    MatcherPart,
+    MatcherPartDecimal,
+    MatcherPartLetters,
+    MatcherPartLookup,
+    MatcherPartRoman,
+    MatcherPartTimeZone,
+    MatcherPartWords,
+    PictureFormat,
+    PictureMatcher,
+    RomanNumeral,
+    SpecPart,
+    TCase,
+    YearMonth,
+)
 
-# Get all .py files in the current directory except __init__.py
-module_files = glob.glob(os.path.join(os.path.dirname(__file__), "*.py"))
-for path in module_files:
-    module = os.path.splitext(os.path.basename(path))[0]
-    if module != "__init__":
-        __all__.append(module)
-    exec(f"from src.jsonata.DateTimeUtils.{module} import *")
+__all__ = [
+    "DateTimeUtils",
+    "Format",
+    "Formats",
+    "GroupingSeparator",
+    "LiteralSpecPart",
+    "MatcherPart",
+    "MatcherPartDecimal",
+    "MatcherPartLetters",
+    "MatcherPartLookup",
+    "MatcherPartRoman",
+    "MatcherPartTimeZone",
+    "MatcherPartWords",
+    "PictureFormat",
+    "PictureMatcher",
+    "RomanNumeral",
+    "SpecPart",
+    "TCase",
+    "YearMonth",
+]
@@ -5,10 +5,10 @@ Comparator module for JSONata Python implementation.
 Provides utilities for wrapping comparator functions or objects, enabling sorting and grouping in JSONata expressions.
 """
 
+import functools
+from typing import Any, Callable, Optional
 
-from collections.abc import Callable
-from typing import Any, Optional
-
+from src.jsonata.Functions.Functions import Functions
 from src.jsonata.Jsonata.JLambda import JLambda
 
 
@@ -17,7 +17,10 @@ class Comparator:
     Wraps a comparator function or object for use in Jsonata sorting/grouping.
     """
 
+    __slots__ = ("_comparator", "_apply")
+
     _comparator: Optional[Any]
+    _apply: Any
 
     def __init__(self, comparator):
         """
@@ -25,10 +28,11 @@ class Comparator:
         Args:
             comparator (Any): A callable or comparator object.
         """
-        if isinstance(comparator, Callable):
+        if callable(comparator):
             self._comparator = JLambda(comparator)
         else:
             self._comparator = comparator
+        self._apply = Functions.func_apply
 
     def compare(self, o1, o2):
         """
@@ -37,11 +41,21 @@ class Comparator:
             o1: First object.
             o2: Second object.
         Returns:
-            int: 1 if o1 > o2, -1 if o1 < o2, or result of comparator.
+            int: 1 if o1 > o2, -1 if o1 < o2, or the sign of a numeric result.
         """
-        from src.jsonata.Functions.Functions import Functions
-
-        res = Functions.func_apply(self._comparator, [o1, o2])
-        if isinstance(res, bool):
-            return 1 if res else -1
-        return int(res)
+        res = self._apply(self._comparator, [o1, o2])
+        if res is True:
+            return 1
+        if res is False:
+            return -1
+        return (res > 0) - (res < 0)
+
+    def key_fn(self) -> Callable[[Any], Any]:
+        """
+        Return a sort key function for use with sorted/list.sort.
+        A user comparator is an arbitrary function, so no projection can be
+        extracted from it and the key simply adapts compare via cmp_to_key.
+        Returns:
+            Callable[[Any], Any]: Key function built from compare.
+        """
+        return functools.cmp_to_key(self.compare)
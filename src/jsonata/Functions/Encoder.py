@@ -8,11 +8,25 @@ Provides a custom JSON encoder for handling decimals and special types in JSONat
 
 import decimal
 import json
+import math
 
 from src.jsonata.Utils.Utils import Utils
 from src.jsonata.Parser import Parser
 from src.jsonata.Jsonata.JFunction import JFunction
 
+# Shared 15-digit context used to render numbers
+_CTX15 = decimal.Context(prec=15)
+
+# Element types of the flat number lists encoded in one join
+_INT_TYPES = frozenset((int,))
+_FLOAT_TYPES = frozenset((float,))
+
+# Integers below this magnitude fit in 15 digits and render unchanged
+_MAX_EXACT_INT = 10**15
+
+# Functions.remove_exponent, resolved on first use (Functions imports this module)
+_remove_exponent = None
+
 
 class Encoder(json.JSONEncoder):
     """
@@ -27,15 +41,49 @@ class Encoder(json.JSONEncoder):
         Returns:
             str: Encoded JSON string.
         """
+        if type(o) is int and -_MAX_EXACT_INT < o < _MAX_EXACT_INT:
+            return str(o)
         if not isinstance(o, bool) and isinstance(o, (int, float)):
-            d = decimal.Decimal(o)
-            from src.jsonata.Functions.Functions import Functions
+            global _remove_exponent
+            if _remove_exponent is None:
+                from src.jsonata.Functions.Functions import Functions
 
-            res = Functions.remove_exponent(d, decimal.Context(prec=15))
+                _remove_exponent = Functions.remove_exponent
+            if isinstance(o, float):
+                d = decimal.Decimal.from_float(o)
+            else:
+                d = decimal.Decimal(o)
+            res = _remove_exponent(d, _CTX15)
             return str(res).lower()
 
         return super().encode(o)
 
+    def iterencode(self, o, _one_shot=False):
+        """
+        Encode an object in chunks, joining flat lists of numbers in one step.
+        When indenting, the standard encoder falls back to its pure Python
+        implementation; a list holding only ints, or only finite floats, is then
+        rendered with a single str.join, laid out exactly as that encoder would.
+        Args:
+            o: Object to encode.
+            _one_shot: Passed through to the standard encoder.
+        Returns:
+            Iterable[str]: Encoded JSON chunks.
+        """
+        if self.indent is not None and type(o) is list and o:
+            kinds = set(map(type, o))
+            if kinds == _INT_TYPES or (
+                kinds == _FLOAT_TYPES and all(map(math.isfinite, o))
+            ):
+                items = map(repr, o)
+                indent = self.indent
+                if not isinstance(indent, str):
+                    indent = " " * indent
+                newline_indent = "\n" + indent
+                separator = self.item_separator + newline_indent
+                return ["[" + newline_indent + separator.join(items) + "\n]"]
+        return super().iterencode(o, _one_shot)
+
     def default(self, o):
         """
         Provide a default encoding for special Jsonata types.
@@ -33,7 +33,6 @@ import base64
 import builtins
 import datetime
 import decimal
-import functools
 import inspect
 import json
 import math
@@ -2296,8 +2295,7 @@ class Functions:
             return arr
         result = list(arr)
         if comparator is not None:
-            comp = Comparator(comparator).compare
-            result = sorted(result, key=functools.cmp_to_key(comp))
+            result = sorted(result, key=Comparator(comparator).key_fn())
         else:
             result = sorted(result)
         return result
@@ -20,6 +20,8 @@ class RegexpMatch:
         groups (Sequence[AnyStr]): The captured groups from the match.
     """
 
+    __slots__ = ("match", "index", "groups")
+
     match: str
     index: int
     groups: Sequence[AnyStr]
@@ -5,8 +5,8 @@ ComparatorWrapper module for Jsonata Python implementation.
 Defines the ComparatorWrapper class for sorting sequences in Jsonata, supporting tuple and non-tuple sorts.
 """
 
-
-from typing import Optional, TYPE_CHECKING
+import functools
+from typing import Any, Callable, Optional, Sequence, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from src.jsonata.Jsonata.Jsonata import Jsonata
@@ -15,16 +15,56 @@ from src.jsonata.JException.JException import JException
 from src.jsonata.Jsonata.Frame import Frame
 from src.jsonata.Parser.Symbol import Symbol
 
+_NUMBER_TYPES = frozenset((int, float))
+_STRING_TYPES = frozenset((str,))
+
+# Type tags for sort keys: only numbers and strings are sortable, and only
+# against keys with the same tag
+_TAG_NUMBER = 1
+_TAG_STRING = 2
+_TAG_OTHER = 3
+
+
+def _type_tag(value) -> int:
+    """
+    Classify a defined sort key by the type that governs its ordering.
+    Args:
+        value: The sort key (not None).
+    Returns:
+        int: _TAG_NUMBER, _TAG_STRING or _TAG_OTHER.
+    """
+    t = type(value)
+    if t is int or t is float:
+        return _TAG_NUMBER
+    if t is str:
+        return _TAG_STRING
+    if isinstance(value, bool):
+        return _TAG_OTHER
+    if isinstance(value, (int, float)):
+        return _TAG_NUMBER
+    if isinstance(value, str):
+        return _TAG_STRING
+    return _TAG_OTHER
+
 
 class ComparatorWrapper:
     """
     Comparator for sorting sequences in JSONata, supporting tuple and non-tuple sorts.
     """
 
+    __slots__ = (
+        "_outer_instance",
+        "_expr",
+        "_environment",
+        "_is_tuple_sort",
+        "_evaluate_term",
+    )
+
     _outer_instance: "Jsonata"
     _expr: Optional[Symbol]
     _environment: Optional[Frame]
     _is_tuple_sort: bool
+    _evaluate_term: Callable[[Symbol, Any], Any]
 
     def __init__(self, outer_instance, expr, environment, is_tuple_sort):
         """
@@ -39,6 +79,92 @@ class ComparatorWrapper:
         self._expr = expr
         self._environment = environment
         self._is_tuple_sort = is_tuple_sort
+        self._evaluate_term = ComparatorWrapper._make_evaluator(
+            outer_instance, environment, is_tuple_sort
+        )
+
+    def sort(self, items: Optional[Sequence]) -> Optional[Sequence]:
+        """
+        Sort items according to the sort expression.
+        For a single-term sort each item's key is evaluated exactly once up front,
+        so comparisons reuse the precomputed keys instead of re-evaluating the term;
+        all-numeric or all-string keys are then ordered by the builtin sort directly.
+        Args:
+            items: Sequence to sort.
+        Returns:
+            Sorted list, or the input unchanged if it has fewer than two items.
+        Raises:
+            JException: If types are incompatible for sorting.
+        """
+        if items is None or len(items) <= 1:
+            return items
+        if len(self._expr.terms) != 1:
+            return self._sort_cached(items)
+
+        term = self._expr.terms[0]
+        keys = [self._evaluate_term(term, item) for item in items]
+
+        order = ComparatorWrapper._native_order(keys, term.descending)
+        if order is None:
+
+            def compare_indexes(i, j):
+                return self._compare_keys(keys[i], keys[j], term)
+
+            order = sorted(range(len(keys)), key=functools.cmp_to_key(compare_indexes))
+        return [items[i] for i in order]
+
+    def _sort_cached(self, items: Sequence) -> list:
+        """
+        Sort items on several terms, memoizing each item's keys for this sort.
+        Keys are evaluated lazily in term order, so a term is only evaluated for
+        an item once a comparison involving that item reaches it.
+        Args:
+            items: Sequence to sort.
+        Returns:
+            list: Sorted items.
+        Raises:
+            JException: If types are incompatible for sorting.
+        """
+        terms = self._expr.terms
+        cache = [[] for _ in range(len(items))]
+
+        def key(i, index):
+            keys = cache[i]
+            if index == len(keys):
+                keys.append(self._evaluate_term(terms[index], items[i]))
+            return keys[index]
+
+        def compare_indexes(i, j):
+            for index, term in enumerate(terms):
+                comp = self._compare_keys(key(i, index), key(j, index), term)
+                if comp != 0:
+                    return comp
+            return 0
+
+        order = sorted(range(len(items)), key=functools.cmp_to_key(compare_indexes))
+        return [items[i] for i in order]
+
+    @staticmethod
+    def _native_order(keys: list, descending: bool) -> Optional[list]:
+        """
+        Order key indexes with the builtin sort when all keys are directly comparable.
+        Applies when every defined key is a number, or every defined key is a string;
+        undefined keys keep their relative order and go last, as in _compare_keys.
+        Args:
+            keys: Evaluated sort keys, one per item.
+            descending: Whether the term sorts in descending order.
+        Returns:
+            Optional[list]: Item indexes in sorted order, or None if the keys need
+            the full comparator (mixed or unsupported types).
+        """
+        defined = [i for i, k in enumerate(keys) if k is not None]
+        kinds = {type(keys[i]) for i in defined}
+        if not (kinds <= _NUMBER_TYPES or kinds == _STRING_TYPES):
+            return None
+        order = sorted(defined, key=keys.__getitem__, reverse=descending)
+        if len(order) < len(keys):
+            order.extend(i for i, k in enumerate(keys) if k is None)
+        return order
 
     def compare(self, a, b):
         """
@@ -51,63 +177,65 @@ class ComparatorWrapper:
         Raises:
             JException: If types are incompatible for sorting.
         """
-        comp = 0
-        index = 0
-        while comp == 0 and index < len(self._expr.terms):
-            term = self._expr.terms[index]
-            context = a
-            env = self._environment
-            if self._is_tuple_sort:
-                context = a["@"]
-                env = self._outer_instance.create_frame_from_tuple(self._environment, a)
-            aa = self._outer_instance.eval(term.expression, context, env)
-
-            context = b
-            env = self._environment
-            if self._is_tuple_sort:
-                context = b["@"]
-                env = self._outer_instance.create_frame_from_tuple(self._environment, b)
-            bb = self._outer_instance.eval(term.expression, context, env)
-
-            if aa is None:
-                comp = 0 if (bb is None) else 1
-                index += 1
-                continue
-            if bb is None:
-                comp = -1
-                index += 1
-                continue
-
-            if not (
-                (not isinstance(aa, bool) and isinstance(aa, (int, float)))
-                or isinstance(aa, str)
-            ) or not (
-                (not isinstance(bb, bool) and isinstance(bb, (int, float)))
-                or isinstance(bb, str)
-            ):
-                raise JException("T2008", self._expr.position, aa, bb)
-
-            same_type = False
-            if (
-                not isinstance(aa, bool)
-                and isinstance(aa, (int, float))
-                and not isinstance(bb, bool)
-                and isinstance(bb, (int, float))
-            ):
-                same_type = True
-            elif issubclass(type(bb), type(aa)) or issubclass(type(aa), type(bb)):
-                same_type = True
-
-            if not same_type:
-                raise JException("T2007", self._expr.position, aa, bb)
-            if aa == bb:
-                index += 1
-                continue
-            if aa < bb:
-                comp = -1
-            else:
-                comp = 1
-            if term.descending:
-                comp = -comp
-            index += 1
-        return comp
+        for term in self._expr.terms:
+            aa = self._evaluate_term(term, a)
+            bb = self._evaluate_term(term, b)
+            comp = self._compare_keys(aa, bb, term)
+            if comp != 0:
+                return comp
+        return 0
+
+    @staticmethod
+    def _make_evaluator(outer_instance, environment, is_tuple_sort):
+        """
+        Build the function that evaluates a sort term against a single item.
+        The evaluator is specialised once per sort for tuple or plain items, with
+        the Jsonata methods and environment bound as closure variables.
+        Args:
+            outer_instance: The Jsonata instance.
+            environment: The evaluation environment.
+            is_tuple_sort: Whether sorting tuple streams.
+        Returns:
+            Callable: evaluate(term, item) returning the item's key for the term.
+        """
+        evaluate = outer_instance.eval
+        if is_tuple_sort:
+            create_frame = outer_instance.create_frame_from_tuple
+
+            def evaluate_tuple(term, item):
+                return evaluate(
+                    term.expression, item["@"], create_frame(environment, item)
+                )
+
+            return evaluate_tuple
+
+        def evaluate_item(term, item):
+            return evaluate(term.expression, item, environment)
+
+        return evaluate_item
+
+    def _compare_keys(self, aa, bb, term):
+        """
+        Compare two evaluated sort keys for a single term.
+        Args:
+            aa: Key of the first item.
+            bb: Key of the second item.
+            term: The sort term the keys were evaluated for.
+        Returns:
+            int: -1, 0 or 1; undefined keys sort last regardless of direction.
+        Raises:
+            JException: If types are incompatible for sorting.
+        """
+        if aa is None:
+            return 0 if (bb is None) else 1
+        if bb is None:
+            return -1
+
+        tag_a = _type_tag(aa)
+        tag_b = _type_tag(bb)
+        if tag_a == _TAG_OTHER or tag_b == _TAG_OTHER:
+            raise JException("T2008", self._expr.position, aa, bb)
+        if tag_a != tag_b:
+            raise JException("T2007", self._expr.position, aa, bb)
+        comp = (aa > bb) - (aa < bb)
+        return -comp if term.descending else comp
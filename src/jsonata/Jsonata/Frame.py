@@ -6,6 +6,7 @@ Defines the Frame class for environment frames, variable bindings, and scope man
 """
 
 
+import sys
 from collections.abc import Callable
 from typing import Any, MutableMapping, Optional
 from src.jsonata.Timebox.Timebox import Timebox
@@ -17,6 +18,8 @@ class Frame:
     Represents an environment frame for variable bindings and scope management in JSONata.
     """
 
+    __slots__ = ("bindings", "parent", "is_parallel_call")
+
     bindings: MutableMapping[str, Any]
     parent: Optional["Frame"]
     is_parallel_call: bool
@@ -38,6 +41,8 @@ class Frame:
             name: The variable name.
             val: The value to bind.
         """
+        if type(name) is str:
+            name = sys.intern(name)
         self.bindings[name] = val
         if getattr(val, "signature", None) is not None:
             val.signature.set_function_name(name)
@@ -50,11 +55,13 @@ class Frame:
         Returns:
             The value bound to the name, or None if not found.
         """
-        val = self.bindings.get(name, Utils.NONE)
-        if val is not Utils.NONE:
-            return val
-        if self.parent is not None:
-            return self.parent.lookup(name)
+        none = Utils.NONE
+        frame = self
+        while frame is not None:
+            val = frame.bindings.get(name, none)
+            if val is not none:
+                return val
+            frame = frame.parent
         return None
 
     def set_runtime_bounds(self, timeout: int, max_recursion_depth: int) -> None:
@@ -19,5 +19,7 @@ class GroupEntry:
         exprIndex: The index of the expression that generated this group.
     """
 
+    __slots__ = ("data", "exprIndex")
+
     data: Optional[Any]
     exprIndex: int
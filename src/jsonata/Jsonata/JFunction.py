@@ -14,6 +14,7 @@ from src.jsonata.Jsonata.JFunctionCallable import JFunctionCallable
 from src.jsonata.Jsonata.JFunctionSignatureValidation import (
     JFunctionSignatureValidation,
 )
+from src.jsonata.Signature.Signature import Signature
 
 
 class JFunction(JFunctionCallable, JFunctionSignatureValidation):
@@ -21,6 +22,8 @@ class JFunction(JFunctionCallable, JFunctionSignatureValidation):
     Represents a JSONata function with signature validation and callable interface.
     """
 
+    __slots__ = ("function", "signature", "function_name")
+
     function: "JFunctionCallable"
     signature: Optional["Signature"]
     function_name: Optional[str]
@@ -32,8 +35,6 @@ class JFunction(JFunctionCallable, JFunctionSignatureValidation):
             function: The callable function implementation.
             signature: The signature string or object.
         """
-        from src.jsonata.Signature.Signature import Signature
-
         self.function = function
         if signature is not None:
             self.signature = Signature(signature, str(type(function)))
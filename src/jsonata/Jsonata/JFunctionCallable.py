@@ -14,6 +14,8 @@ class JFunctionCallable:
     Interface for callable JSONata functions.
     """
 
+    __slots__ = ()
+
     def call(self, input_: Optional[Any], args: Optional[Sequence]) -> Optional[Any]:
         """
         Call the function with the given input and arguments.
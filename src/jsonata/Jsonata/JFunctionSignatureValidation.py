@@ -14,6 +14,8 @@ class JFunctionSignatureValidation:
     Interface for validating function signatures in JSONata.
     """
 
+    __slots__ = ()
+
     def validate(self, args: Optional[Any], context: Optional[Any]) -> Optional[Any]:
         """
         Validate the arguments against the function signature.
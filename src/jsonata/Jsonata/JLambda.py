@@ -20,6 +20,8 @@ class JLambda(JFunctionCallable, JFunctionSignatureValidation):
     Represents a JSONata lambda function with signature validation and callable interface.
     """
 
+    __slots__ = ("function",)
+
     function: Callable
 
     def __init__(self, function):
@@ -39,9 +41,8 @@ class JLambda(JFunctionCallable, JFunctionSignatureValidation):
         Returns:
             The result of the function call.
         """
-        if isinstance(args, list):
+        if args:
             return self.function(*args)
-
         return self.function()
 
     def validate(self, args: Optional[Any], context: Optional[Any]) -> Optional[Any]:
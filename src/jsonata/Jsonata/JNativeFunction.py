@@ -5,10 +5,71 @@ JNativeFunction module for Jsonata Python implementation.
 Defines the JNativeFunction class for wrapping native Python implementations and signatures in Jsonata.
 """
 
+import functools
 import inspect
-from typing import Any, Optional, Sequence
+import logging
+import sys
+from typing import Any, Callable, Optional, Sequence
 from src.jsonata.Jsonata.JFunction import JFunction
 from src.jsonata.Signature.Signature import Signature
+from src.jsonata.Utils.Utils import Utils
+
+# Functions._call, resolved on first construction (Functions is imported lazily)
+_call_native = None
+
+
+@functools.lru_cache(maxsize=None)
+def _lookup_method(clz: Any, name: str) -> Optional[Any]:
+    """
+    Resolve a native implementation method by name, once per (class, name).
+    Args:
+        clz: Class containing the implementation.
+        name: Name of the implementation method.
+    Returns:
+        Optional[Any]: The implementation method.
+    """
+    from src.jsonata.Functions.Functions import Functions
+
+    return Functions.get_function(clz, name)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_nargs(method: Any) -> int:
+    """
+    Count the parameters of a native implementation method.
+    The same methods back every Jsonata instance, so the signature is only
+    inspected the first time each one is wrapped.
+    Args:
+        method: The implementation method.
+    Returns:
+        int: Number of parameters.
+    """
+    return len(inspect.signature(method).parameters)
+
+
+def _make_invoker(method: Any, nargs: int) -> Callable[[Sequence], Any]:
+    """
+    Build the function that invokes a native implementation with call arguments.
+    Calls supplying at least nargs arguments go straight to the method; shorter
+    argument lists are padded with None by Functions._call.
+    Args:
+        method: The implementation method.
+        nargs: Number of parameters of the method.
+    Returns:
+        Callable: invoke(args) returning the normalized result.
+    """
+    is_numeric = Utils.is_numeric
+    convert_number = Utils.convert_number
+
+    def invoke(args):
+        if len(args) < nargs:
+            return _call_native(method, nargs, args)
+        res = method(*args)
+        if is_numeric(res):
+            res = convert_number(res)
+        return res
+
+    return invoke
 
 
 class JNativeFunction(JFunction):
@@ -16,11 +77,14 @@ class JNativeFunction(JFunction):
     Represents a native function in Jsonata, wrapping Python implementations and signatures.
     """
 
+    __slots__ = ("method", "nargs", "_invoke")
+
     function_name: str
     signature: Optional[Signature]
     clz: Any
     method: Optional[Any]
     nargs: int
+    _invoke: Callable[[Sequence], Any]
 
     def __init__(self, function_name, signature, clz, impl_method_name):
         """
@@ -32,25 +96,27 @@ class JNativeFunction(JFunction):
             impl_method_name: Name of the implementation method.
         """
         super().__init__(None, None)
+        # names are interned once here since they key frame bindings and lookups
+        function_name = sys.intern(function_name)
         self.function_name = function_name
         self.signature = Signature(signature, function_name)
         if impl_method_name is None:
             impl_method_name = self.function_name
+        else:
+            impl_method_name = sys.intern(impl_method_name)
         from src.jsonata.Functions.Functions import Functions
 
-        self.method = Functions.get_function(clz, impl_method_name)
-        self.nargs = (
-            len(inspect.signature(self.method).parameters)
-            if self.method is not None
-            else 0
-        )
+        global _call_native
+        if _call_native is None:
+            _call_native = Functions._call
+
+        self.method = _lookup_method(clz, impl_method_name)
+        self.nargs = _get_nargs(self.method) if self.method is not None else 0
+        self._invoke = _make_invoker(self.method, self.nargs)
 
         if self.method is None:
-            print(
-                "Function not implemented: "
-                + function_name
-                + " impl="
-                + impl_method_name
+            logging.warning(
+                "Function not implemented: %s impl=%s", function_name, impl_method_name
             )
 
     def call(
@@ -64,9 +130,7 @@ class JNativeFunction(JFunction):
         Returns:
             The result of the function call.
         """
-        from src.jsonata.Functions.Functions import Functions
-
-        return Functions.call(self.method, self.nargs, args)
+        return self._invoke(args)
 
     def get_number_of_args(self) -> int:
         """
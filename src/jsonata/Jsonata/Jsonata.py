@@ -1383,7 +1383,7 @@ class Jsonata:
 
         from src.jsonata.Jsonata.ComparatorWrapper import ComparatorWrapper
 
-        comparator = ComparatorWrapper(self, expr, environment, is_tuple_sort).compare
+        comparator = ComparatorWrapper(self, expr, environment, is_tuple_sort)
 
         #  var focus = {
         #      environment: environment,
@@ -1392,7 +1392,7 @@ class Jsonata:
         #  // the `focus` is passed in as the `this` for the invoked function
         #  result = /* await */ fn.sort.apply(focus, [lhs, comparator])
 
-        result = Functions.sort(lhs, comparator)
+        result = comparator.sort(lhs)
         return result
 
     #
@@ -56,6 +56,9 @@ class Signature:
 
     SERIAL_VERSION_UID = -450755246855587271
 
+    # Upper bound on the distinct argument type strings remembered per signature
+    _MATCH_CACHE_SIZE = 64
+
     signature: str
     function_name: str
 
@@ -64,6 +67,7 @@ class Signature:
     _prev_param: "Param"
     _regex: Optional[re.Pattern]
     _signature: str
+    _match_cache: dict[str, Optional[re.Match]]
 
     def __init__(self, signature, function):
         """
@@ -77,6 +81,7 @@ class Signature:
         self._prev_param = self._param
         self._regex = None
         self._signature = ""
+        self._match_cache = {}
 
         self.function_name = function
         self.parse_signature(signature)
@@ -314,7 +319,12 @@ class Signature:
         for arg in args:
             supplied_sig += self.get_symbol(arg)
 
-        is_valid = self._regex.fullmatch(supplied_sig)
+        # the match depends only on the argument type string, so remember it
+        is_valid = self._match_cache.get(supplied_sig, Utils.NONE)
+        if is_valid is Utils.NONE:
+            is_valid = self._regex.fullmatch(supplied_sig)
+            if len(self._match_cache) < Signature._MATCH_CACHE_SIZE:
+                self._match_cache[supplied_sig] = is_valid
         if is_valid is not None:
             validated_args = []
             arg_index = 0
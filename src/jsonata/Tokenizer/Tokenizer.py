@@ -35,6 +35,7 @@ Adapted from jsonata-java and IBM JSONata projects.
 
 import math
 import re
+import sys
 from dataclasses import dataclass
 from typing import Any, Optional
 
@@ -348,7 +349,8 @@ class Tokenizer:
             ):
                 if self.path[self.position] == "$":
                     # variable reference
-                    name = self.path[self.position + 1 : i]
+                    # interned so scope lookups can match bindings by identity
+                    name = sys.intern(self.path[self.position + 1 : i])
                     self.position = i
                     return self.create("variable", name)
                 else:
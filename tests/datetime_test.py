@@ -0,0 +1,30 @@
+﻿import jsonata
+
+
+#
+# see https://docs.jsonata.org/date-time-functions#tomillis
+#
+class TestDateTime:
+
+    def test_parse_numeric(self):
+        assert jsonata.Jsonata("$toMillis('2018-10-21', '[Y0001]-[M01]-[D01]')").evaluate(None) == 1540080000000
+
+    def test_parse_day_in_words(self):
+        assert jsonata.Jsonata("$toMillis('2018-10-twenty-one', '[Y0001]-[M01]-[Dw]')").evaluate(None) == 1540080000000
+        assert jsonata.Jsonata("$toMillis('2018-10-twenty-first', '[Y0001]-[M01]-[Dw]')").evaluate(None) == 1540080000000
+        assert jsonata.Jsonata("$toMillis('twenty-first of October 2018', '[Dwo] of [MNn] [Y0001]')").evaluate(None) == 1540080000000
+
+    def test_parse_year_in_words(self):
+        assert jsonata.Jsonata("$toMillis('one thousand nine hundred and ninety-nine', '[Yw]')").evaluate(None) == 915148800000
+
+    def test_parse_literal_dot(self):
+        assert jsonata.Jsonata("$toMillis('2018.10.21', '[Y0001].[M01].[D01]')").evaluate(None) == 1540080000000
+        assert jsonata.Jsonata("$toMillis('2018x10x21', '[Y0001].[M01].[D01]')").evaluate(None) is None
+
+    def test_parse_literal_parenthesis(self):
+        assert jsonata.Jsonata("$toMillis('(2018)', '([Y0001])')").evaluate(None) == 1514764800000
+        assert jsonata.Jsonata("$toMillis('(2018-10-21)', '([Y0001]-[M01]-[D01])')").evaluate(None) == 1540080000000
+
+    def test_parse_literal_non_ascii(self):
+        assert jsonata.Jsonata("$toMillis('2018Ä10', '[Y0001]ä[M01]')").evaluate(None) == 1538352000000
+        assert jsonata.Jsonata("$toMillis('2018É10', '[Y0001]é[M01]')").evaluate(None) == 1538352000000
@@ -0,0 +1,30 @@
+﻿import json
+
+from jsonata.Functions.Encoder import Encoder
+
+
+class TestEncoder:
+
+    lists = [
+        [1, 2, 3],
+        [-7, 0, 10**20],
+        [0.5, -2.25, 1e300, 5e-324, -0.0],
+        [1.0, 2.0],
+        [float("inf"), 1.5],
+        [True, False],
+        [True, 1, 2],
+        [1, 2.5],
+        [1, None, "x"],
+        [[1, 2], [3.5]],
+        [7],
+        [],
+    ]
+
+    def test_indent_matches_json(self):
+        for indent in (0, 2, 4, "  ", "\t"):
+            for o in self.lists:
+                assert json.dumps(o, cls=Encoder, indent=indent) == json.dumps(o, indent=indent)
+
+    def test_compact_matches_json(self):
+        for o in self.lists:
+            assert json.dumps(o, cls=Encoder, separators=(",", ":")) == json.dumps(o, separators=(",", ":"))
@@ -0,0 +1,44 @@
+﻿import jsonata
+import pytest
+
+
+#
+# see https://docs.jsonata.org/numeric-functions#formatinteger
+# and https://docs.jsonata.org/numeric-functions#parseinteger
+#
+class TestInteger:
+
+    def test_parse_roman(self):
+        assert jsonata.Jsonata("$parseInteger('MCMXCIX', 'I')").evaluate(None) == 1999
+        assert jsonata.Jsonata("$parseInteger('xiv', 'i')").evaluate(None) == 14
+
+    def test_parse_roman_invalid(self):
+        with pytest.raises(Exception):
+            jsonata.Jsonata("$parseInteger('XQV', 'I')").evaluate(None)
+        with pytest.raises(Exception):
+            jsonata.Jsonata("$parseInteger('abc', 'I')").evaluate(None)
+        with pytest.raises(Exception):
+            jsonata.Jsonata("$parseInteger('XIVé', 'I')").evaluate(None)
+
+    def test_parse_words(self):
+        assert jsonata.Jsonata("$parseInteger('one hundred', 'w')").evaluate(None) == 100
+        assert jsonata.Jsonata("$parseInteger('one hundred and twenty-three', 'w')").evaluate(None) == 123
+        assert jsonata.Jsonata("$parseInteger('twenty-first', 'w;o')").evaluate(None) == 21
+
+    def test_format_roman(self):
+        assert jsonata.Jsonata("$formatInteger(1999, 'I')").evaluate(None) == "MCMXCIX"
+        assert jsonata.Jsonata("$formatInteger(14, 'i')").evaluate(None) == "xiv"
+
+    def test_format_words(self):
+        assert jsonata.Jsonata("$formatInteger(123, 'w')").evaluate(None) == "one hundred and twenty-three"
+        assert jsonata.Jsonata("$formatInteger(21, 'W')").evaluate(None) == "TWENTY-ONE"
+        assert jsonata.Jsonata("$formatInteger(5, 'w;o')").evaluate(None) == "fifth"
+
+    def test_format_decimal(self):
+        assert jsonata.Jsonata("$formatInteger(1234567, '#,##0')").evaluate(None) == "1,234,567"
+        assert jsonata.Jsonata("$formatInteger(3, '001')").evaluate(None) == "003"
+
+    def test_format_ordinal(self):
+        assert jsonata.Jsonata("$formatInteger(2, '1;o')").evaluate(None) == "2nd"
+        assert jsonata.Jsonata("$formatInteger(11, '1;o')").evaluate(None) == "11th"
+        assert jsonata.Jsonata("$formatInteger(23, '1;o')").evaluate(None) == "23rd"
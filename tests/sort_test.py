@@ -0,0 +1,59 @@
+﻿import jsonata
+import pytest
+
+
+#
+# see https://docs.jsonata.org/path-operators#-order-by
+#
+class TestSort:
+
+    data = [
+        {"name": "b", "price": 2, "qty": 5},
+        {"name": "a", "price": 1, "qty": 7},
+        {"name": "c", "price": 2, "qty": 3},
+        {"name": "d", "qty": 1},
+        {"name": "e", "price": 3, "qty": 5},
+    ]
+
+    def names(self, expr):
+        return jsonata.Jsonata(expr + ".name").evaluate(self.data)
+
+    def test_numbers_ascending(self):
+        assert jsonata.Jsonata("$^($)").evaluate([3, 1, 2.5, -4]) == [-4, 1, 2.5, 3]
+        assert jsonata.Jsonata("$^(<$)").evaluate([3, 1, 2.5, -4]) == [-4, 1, 2.5, 3]
+
+    def test_numbers_descending(self):
+        assert jsonata.Jsonata("$^(>$)").evaluate([3, 1, 2.5, -4]) == [3, 2.5, 1, -4]
+
+    def test_strings(self):
+        assert jsonata.Jsonata("$^($)").evaluate(["pear", "apple", "fig"]) == ["apple", "fig", "pear"]
+        assert jsonata.Jsonata("$^(>$)").evaluate(["pear", "apple", "fig"]) == ["pear", "fig", "apple"]
+
+    def test_stable(self):
+        assert self.names("$^(price)") == ["a", "b", "c", "e", "d"]
+        assert self.names("$^(>price)") == ["e", "b", "c", "a", "d"]
+        assert self.names("$^(>qty)") == ["a", "b", "e", "c", "d"]
+
+    def test_missing_keys_last(self):
+        assert self.names("$^(<price)") == ["a", "b", "c", "e", "d"]
+        assert self.names("$^(>price)")[-1] == "d"
+        assert self.names("$^(>qty, price)")[-1] == "d"
+
+    def test_multiple_terms(self):
+        assert self.names("$^(price, >qty)") == ["a", "b", "c", "e", "d"]
+        assert self.names("$^(>price, qty)") == ["e", "c", "b", "a", "d"]
+        assert self.names("$^(>qty, price)") == ["a", "b", "e", "c", "d"]
+        assert self.names("$^(qty, >name)") == ["d", "c", "e", "b", "a"]
+
+    def test_mixed_types(self):
+        with pytest.raises(jsonata.JException) as exc:
+            jsonata.Jsonata("$^($)").evaluate([1, "a", 2])
+        assert exc.value.error == "T2007"
+        with pytest.raises(jsonata.JException) as exc:
+            jsonata.Jsonata("$^(>price, name = 'b' ? 'x' : 1)").evaluate(self.data[:3] + [{"price": 2}])
+        assert exc.value.error == "T2007"
+
+    def test_unsortable_type(self):
+        with pytest.raises(jsonata.JException) as exc:
+            jsonata.Jsonata("$^($)").evaluate([1, True])
+        assert exc.value.error == "T2008"
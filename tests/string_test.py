@@ -42,6 +42,19 @@ class TestString:
         assert (jsonata.Jsonata("($matcher := $eval('/^' & 'foo' & '/i'); $.$spread()[$.$keys() ~> $matcher])")
                 .evaluate({"foo": 1, "bar": 2}) == {"foo": 1})
 
+    def test_substring(self):
+        # All parameters supplied
+        assert jsonata.Jsonata("$substring('hello', 1, 2)").evaluate(None) == "el"
+        assert jsonata.Jsonata("$substring('hello', -3, 2)").evaluate(None) == "ll"
+        # Optional length omitted, padded with None
+        assert jsonata.Jsonata("$substring('hello', 1)").evaluate(None) == "ello"
+        assert jsonata.Jsonata("$substring('hello', -2)").evaluate(None) == "lo"
+        # Context value used as the first argument
+        assert jsonata.Jsonata("$substring(1, 2)").evaluate("hello") == "el"
+        # Native function passed as a value
+        assert jsonata.Jsonata("$map(['hello', 'world'], function($s) { $substring($s, 1) })").evaluate(None) == ["ello", "orld"]
+        assert jsonata.Jsonata("$map(['a', 'bb'], $length)").evaluate(None) == [1, 2]
+
     #
     # Additional $split tests
     #   